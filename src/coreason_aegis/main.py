@@ -16,21 +16,38 @@ masking, and re-identification processes to enforce data privacy policies.
 
 # mypy: no-warn-unused-ignores
 
-from typing import Any, Optional, Tuple, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
 import anyio
 import httpx
 from coreason_identity.models import UserContext
 from coreason_identity.types import SecretStr
+from presidio_analyzer import RecognizerResult
 
 from coreason_aegis.masking import MaskingEngine
 from coreason_aegis.models import AegisPolicy, DeIdentificationMap
 from coreason_aegis.reidentifier import ReIdentifier
-from coreason_aegis.scanner import Scanner
+from coreason_aegis.scanner import DEFAULT_BATCH_SIZE, Scanner
 from coreason_aegis.utils.logger import logger
 from coreason_aegis.vault import VaultManager
 
 
+def _alert_on_secret_keys(results: Sequence[RecognizerResult]) -> None:
+    """Logs a single credential-exposure warning for any API keys in the scan results.
+
+    Keys found in one text are reported together, so a payload full of keys does not
+    flood the log. The key values themselves are never logged.
+
+    Args:
+        results: The scanner results for one text.
+    """
+    count = sum(1 for result in results if result.entity_type == "SECRET_KEY")
+    if count == 1:
+        logger.warning("Credential Exposure Attempt detected. Redacting API Key.")
+    elif count > 1:
+        logger.warning(f"Credential Exposure Attempt detected. Redacting API Key. ({count} keys)")
+
+
 class AegisAsync:
     """The main async interface for the privacy filter.
 
@@ -42,18 +59,26 @@ class AegisAsync:
         self,
         client: Optional[httpx.AsyncClient] = None,
         vault_ttl: int = 3600,
+        scanner: Optional[Scanner] = None,
+        scan_cache_size: int = 0,
     ) -> None:
         """Initializes the Aegis system and its components.
 
         Args:
             client: Optional httpx.AsyncClient for external connections.
             vault_ttl: TTL for the vault in seconds.
+            scanner: Optional Scanner to use, e.g. one wrapping a custom AnalyzerEngine.
+                A Scanner over the shared engine is created if None.
+            scan_cache_size: Maximum number of scan results the created Scanner memoizes,
+                each for vault_ttl seconds. Default 0 (no caching). Ignored if scanner is given.
         """
         self._internal_client = client is None
         self._client = client or httpx.AsyncClient()
 
         self.vault = VaultManager(ttl_seconds=vault_ttl)
-        self.scanner = Scanner()
+        self.scanner = (
+            scanner if scanner is not None else Scanner(cache_size=scan_cache_size, cache_ttl_seconds=vault_ttl)
+        )
         self.masking_engine = MaskingEngine(self.vault)
         self.reidentifier = ReIdentifier(self.vault)
         self._default_policy = AegisPolicy()
@@ -97,25 +122,14 @@ class AegisAsync:
         active_policy = policy or self._default_policy
 
         try:
-            # 1. Scan (CPU bound)
-            # Wrap synchronous scanner call in thread
-            results = await anyio.to_thread.run_sync(self.scanner.scan, text, active_policy, context)
-
-            # Check for API Keys and alert
-            for result in results:
-                if result.entity_type == "SECRET_KEY":
-                    logger.warning("Credential Exposure Attempt detected. Redacting API Key.")
-
-            # 2. Mask (CPU bound)
-            # Wrap synchronous masking call in thread
-            # Note: MaskingEngine uses VaultManager which is thread-safe for reads/writes if properly implemented,
-            # but currently it's just a dict wrapper.
-            masked_text, deid_map = await anyio.to_thread.run_sync(
-                self.masking_engine.mask, text, results, active_policy, session_id, context
+            # Scan, alert and mask in a single worker-thread hop (CPU bound); the
+            # results never bounce back to the event loop between the stages.
+            masked_text, deid_map, entity_count = await anyio.to_thread.run_sync(
+                self._sanitize_sync, text, session_id, context, active_policy
             )
 
             # Log success (omitting PII)
-            logger.info(f"Sanitized text for session {session_id}. Detected {len(results)} entities.")
+            logger.info(f"Sanitized text for session {session_id}. Detected {entity_count} entities.")
 
             return masked_text, deid_map
 
@@ -124,6 +138,112 @@ class AegisAsync:
             # Fail Closed: Propagate exception
             raise
 
+    async def sanitize_batch(
+        self,
+        texts: Sequence[str],
+        session_ids: Sequence[str],
+        context: UserContext,
+        policy: Optional[AegisPolicy] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Tuple[str, DeIdentificationMap]]:
+        """Scans and masks many texts, batching the NLP pipeline across them.
+
+        Scanning is done in one batched pass; masking then runs per session against
+        that session's vault entry.
+
+        Args:
+            texts: The texts to sanitize.
+            session_ids: The session identifier for each text.
+            context: The user context for auditing.
+            policy: Optional AegisPolicy override. Uses default if None.
+            batch_size: Number of texts processed by the NLP pipeline per batch.
+
+        Returns:
+            A list with one (sanitized text, DeIdentificationMap) tuple per input text.
+
+        Raises:
+            ValueError: If texts and session_ids differ in length.
+            Exception: If sanitization fails (Fail Closed).
+        """
+        if context is None:
+            raise ValueError("UserContext is required")
+        if len(texts) != len(session_ids):
+            raise ValueError("texts and session_ids must have the same length")
+
+        active_policy = policy or self._default_policy
+
+        try:
+            sanitized: List[Tuple[str, DeIdentificationMap]] = await anyio.to_thread.run_sync(
+                self._sanitize_batch_sync, texts, session_ids, context, active_policy, batch_size
+            )
+
+            logger.info(f"Sanitized batch of {len(texts)} texts.")
+            return sanitized
+
+        except Exception as e:
+            logger.error(f"Batch sanitization failed: {e}")
+            # Fail Closed: Propagate exception
+            raise
+
+    def _sanitize_sync(
+        self,
+        text: str,
+        session_id: str,
+        context: UserContext,
+        policy: AegisPolicy,
+    ) -> Tuple[str, DeIdentificationMap, int]:
+        """Scans, alerts on and masks one text on the calling (worker) thread.
+
+        Returns:
+            The masked text, the updated DeIdentificationMap and the number of detected entities.
+        """
+        results = self.scanner.scan(text, policy, context)
+
+        # Check for API Keys and alert
+        _alert_on_secret_keys(results)
+
+        # VaultManager guards its store with a lock, so concurrent calls from worker threads
+        # are safe per read and write; calls for the same session are not serialized.
+        masked_text, deid_map = self.masking_engine.mask(text, results, policy, session_id, context)
+        return masked_text, deid_map, len(results)
+
+    def _sanitize_batch_sync(
+        self,
+        texts: Sequence[str],
+        session_ids: Sequence[str],
+        context: UserContext,
+        policy: AegisPolicy,
+        batch_size: int,
+    ) -> List[Tuple[str, DeIdentificationMap]]:
+        """Batch-scans texts, then alerts on and masks each one, on the calling (worker) thread.
+
+        Texts sharing a session are masked together in input order, so token assignment
+        within a session stays deterministic and the session's map is read from and
+        written to the vault once.
+        """
+        batch_results = self.scanner.scan_batch(texts, policy, context, batch_size)
+
+        sessions: Dict[str, List[int]] = {}
+        for index, session_id in enumerate(session_ids):
+            sessions.setdefault(session_id, []).append(index)
+
+        sanitized: Dict[int, Tuple[str, DeIdentificationMap]] = {}
+        for indices in sessions.values():
+            for index in indices:
+                _alert_on_secret_keys(batch_results[index])
+            # One vault read and write per session rather than per text.
+            masked = self.masking_engine.mask_many(
+                [texts[index] for index in indices],
+                [batch_results[index] for index in indices],
+                policy,
+                session_ids[indices[0]],
+                context,
+            )
+            for index, item in zip(indices, masked, strict=True):
+                sanitized[index] = item
+
+        return [sanitized[index] for index in range(len(texts))]
+
     async def desanitize(
         self,
         text: str,
@@ -170,14 +290,18 @@ class Aegis:
         self,
         client: Optional[httpx.AsyncClient] = None,
         vault_ttl: int = 3600,
+        scanner: Optional[Scanner] = None,
+        scan_cache_size: int = 0,
     ) -> None:
         """Initializes the Aegis facade.
 
         Args:
             client: Optional httpx.AsyncClient (passed to AegisAsync).
             vault_ttl: TTL for the vault in seconds.
+            scanner: Optional Scanner (passed to AegisAsync).
+            scan_cache_size: Scan memoization size (passed to AegisAsync).
         """
-        self._async = AegisAsync(client=client, vault_ttl=vault_ttl)
+        self._async = AegisAsync(client=client, vault_ttl=vault_ttl, scanner=scanner, scan_cache_size=scan_cache_size)
 
     def __enter__(self) -> "Aegis":
         """Context manager entry."""
@@ -201,6 +325,20 @@ class Aegis:
             anyio.run(self._async.sanitize, text, session_id, context, policy),
         )
 
+    def sanitize_batch(
+        self,
+        texts: Sequence[str],
+        session_ids: Sequence[str],
+        context: UserContext,
+        policy: Optional[AegisPolicy] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Tuple[str, DeIdentificationMap]]:
+        """Scans and masks many texts in one batched pass (blocking)."""
+        return cast(  # type: ignore
+            List[Tuple[str, DeIdentificationMap]],
+            anyio.run(self._async.sanitize_batch, texts, session_ids, context, policy, batch_size),
+        )
+
     def desanitize(
         self,
         text: str,
@@ -17,7 +17,11 @@ a session via the VaultManager.
 
 import hashlib
 import string
-from typing import Any, Dict, List, Tuple, cast
+import threading
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Sequence, Tuple, cast
 
 from coreason_identity.models import UserContext
 from faker import Faker
@@ -27,6 +31,132 @@ from coreason_aegis.models import AegisPolicy, DeIdentificationMap, RedactionMod
 from coreason_aegis.vault import VaultManager
 
 
+@lru_cache(maxsize=4096)
+def _compute_suffix(count: int) -> str:
+    """Converts a non-negative index to its bijective base-26 suffix (0 -> A, 26 -> AA).
+
+    Memoized so that very large sessions (past the precomputed table) do not redo the
+    base-26 arithmetic for every token they allocate across calls.
+    """
+    n = count
+    result = ""
+    while True:
+        n, r = divmod(n, 26)
+        result = chr(65 + r) + result
+        if n == 0:
+            break
+        n -= 1
+    return result
+
+
+# Every one- and two-letter suffix (A..ZZ), covering all but the largest sessions.
+_SUFFIX_TABLE_SIZE = 26 + 26 * 26
+_SUFFIX_TABLE: Tuple[str, ...] = tuple(_compute_suffix(i) for i in range(_SUFFIX_TABLE_SIZE))
+
+# Presidio entity types whose token prefix differs from the type name. Any other
+# type (e.g. LOCATION, SECRET_KEY, MRN) is used as its own prefix.
+_ENTITY_TOKEN_PREFIXES = MappingProxyType(
+    {
+        "PERSON": "PATIENT",
+        "DATE_TIME": "DATE",
+        "EMAIL_ADDRESS": "EMAIL",
+        "PHONE_NUMBER": "PHONE",
+        "IP_ADDRESS": "IP",
+    }
+)
+
+# Nominal lifetime recorded on new maps (the vault's TTL governs actual eviction).
+_MAP_LIFETIME = timedelta(hours=1)
+
+# Upper bound on memoized synthetic values kept per MaskingEngine instance.
+SYNTHETIC_CACHE_SIZE = 4096
+
+# Byte -> nucleotide table for synthetic GENE_SEQUENCE values. Four bases divide 256
+# evenly, so the low two bits of each random byte pick a base without bias.
+_GENE_BASES = bytes(b"ATCG"[b & 3] for b in range(256))
+
+# Alphabet for synthetic SECRET_KEY suffixes, built once rather than per entity.
+_SECRET_KEY_ALPHABET: Tuple[str, ...] = tuple(string.ascii_letters + string.digits)
+
+# Empty SHA-256 state; copying it is cheaper than constructing a new hash object per entity.
+_SHA256_TEMPLATE = hashlib.sha256()
+
+
+def _synthetic_seed(text: str) -> int:
+    """Returns the Faker seed for an entity's text: the first 64 bits of its BLAKE2b digest.
+
+    A 64-bit digest is plenty for a seed and avoids building and parsing a 256-bit hex
+    string per entity. The builtin hash() would be cheaper but is salted per process
+    (PYTHONHASHSEED), so separate workers would disagree on the synthetic value for an entity.
+    """
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _sha256_hex(text: str) -> str:
+    """Returns the hex SHA-256 digest of the UTF-8 encoded text."""
+    digest = _SHA256_TEMPLATE.copy()
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _mask_token(entity_type: str) -> str:
+    """Returns the shared MASK-mode token for an entity type (e.g. PERSON -> "[PATIENT]").
+
+    Every occurrence of an entity type reuses one string object instead of
+    normalizing the type and formatting a fresh token per entity.
+    """
+    return f"[{MaskingEngine._normalize_entity_type(entity_type)}]"
+
+
+@lru_cache(maxsize=256)
+def _token_stem(entity_type: str) -> str:
+    """Returns the REPLACE-mode token stem for an entity type (e.g. PERSON -> "[PATIENT_").
+
+    A token is the stem followed by its suffix and a closing bracket.
+    """
+    return f"[{MaskingEngine._normalize_entity_type(entity_type)}_"
+
+
+@lru_cache(maxsize=4096)
+def _indexed_token(entity_type: str, index: int) -> str:
+    """Returns the REPLACE-mode token for the index-th value of an entity type (PERSON, 0 -> "[PATIENT_A]").
+
+    Sessions allocate the same low-numbered tokens over and over, so the formatted
+    strings are shared instead of rebuilt per allocation.
+    """
+    return f"{_token_stem(entity_type)}{MaskingEngine._generate_suffix(index)}]"
+
+
+def _splice(text: str, replacements: Sequence[Tuple[int, int, str]]) -> str:
+    """Rewrites text with each (start, end) span replaced by its token.
+
+    Replacements must be non-overlapping and in ascending start order. The output
+    is stitched together from segments in one pass and joined once, so the cost is
+    linear in the text length however many entities are replaced, with a single
+    allocation for the result.
+
+    Args:
+        text: The original text.
+        replacements: (start, end, replacement) triples.
+
+    Returns:
+        The rewritten text.
+    """
+    if not replacements:
+        return text
+
+    parts: List[str] = []
+    append = parts.append
+    cursor = 0
+    for start, end, repl in replacements:
+        append(text[cursor:start])
+        append(repl)
+        cursor = end
+    append(text[cursor:])
+    return "".join(parts)
+
+
 class MaskingEngine:
     """Masks entities in text and manages de-identification mapping.
 
@@ -44,6 +174,33 @@ class MaskingEngine:
         self.vault = vault
         # Initialize Faker once. We will seed it per usage.
         self.faker = Faker()
+        # Seeding and drawing from the shared Faker must not interleave across threads.
+        self._faker_lock = threading.Lock()
+        # Synthetic values are deterministic in (seed, length, entity_type), so repeats are
+        # served from a bounded per-engine cache without reseeding Faker. The key holds the
+        # seed digest rather than the entity text, so real values are not retained here.
+        self._synthetic_cache = lru_cache(maxsize=SYNTHETIC_CACHE_SIZE)(self._synthesize)
+        # Synthetic value generator per entity type, replacing a per-entity if/elif chain.
+        self._synthesizers: Dict[str, Callable[[int], str]] = {
+            "PERSON": self._synthetic_person,
+            "EMAIL_ADDRESS": self._synthetic_email,
+            "PHONE_NUMBER": self._synthetic_phone,
+            "IP_ADDRESS": self._synthetic_ip,
+            "DATE_TIME": self._synthetic_date,
+            "MRN": self._synthetic_mrn,
+            "PROTOCOL_ID": self._synthetic_protocol_id,
+            "LOT_NUMBER": self._synthetic_lot_number,
+            "GENE_SEQUENCE": self._synthetic_gene_sequence,
+            "CHEMICAL_CAS": self._synthetic_cas,
+            "SECRET_KEY": self._synthetic_secret_key,
+        }
+        # Redaction strategy per mode, looked up once per mask() call.
+        self._replacers: Dict[RedactionMode, Callable[[str, str, DeIdentificationMap], str]] = {
+            RedactionMode.MASK: self._replace_mask,
+            RedactionMode.REPLACE: self._replace_token,
+            RedactionMode.SYNTHETIC: self._replace_synthetic,
+            RedactionMode.HASH: self._replace_hash,
+        }
 
     def mask(
         self,
@@ -70,173 +227,239 @@ class MaskingEngine:
         if context is None:
             raise ValueError("UserContext is required")
 
-        # Retrieve existing map or create new one
+        deid_map = self._load_map(session_id, context)
+        masked_text = self._apply(text, results, policy, deid_map)
+
+        # Save updated map (Only relevant for REPLACE mode,
+        # but saving is harmless/idempotent for others if mapping didn't change)
+        self.vault.save_map(deid_map, context=context)
+
+        return masked_text, deid_map
+
+    def mask_many(
+        self,
+        texts: Sequence[str],
+        results: Sequence[List[RecognizerResult]],
+        policy: AegisPolicy,
+        session_id: str,
+        context: UserContext,
+    ) -> List[Tuple[str, DeIdentificationMap]]:
+        """Masks several texts of one session, reading and writing the vault once.
+
+        Texts are masked in order, so token assignment matches calling mask() on each
+        text in turn.
+
+        Args:
+            texts: The original input texts.
+            results: Entity detection results for each text, in the same order.
+            policy: The AegisPolicy defining the redaction mode (MASK, REPLACE, etc.).
+            session_id: The unique session identifier shared by all texts.
+            context: The user context for auditing.
+
+        Returns:
+            A (masked text, DeIdentificationMap) tuple for each input text, in input order.
+        """
+        if context is None:
+            raise ValueError("UserContext is required")
+
+        deid_map = self._load_map(session_id, context)
+        masked = [
+            self._apply(text, text_results, policy, deid_map) for text, text_results in zip(texts, results, strict=True)
+        ]
+        self.vault.save_map(deid_map, context=context)
+
+        return [(masked_text, deid_map) for masked_text in masked]
+
+    def _load_map(self, session_id: str, context: UserContext) -> DeIdentificationMap:
+        """Retrieves the session's map from the vault, or creates a new (unsaved) one."""
         deid_map = self.vault.get_map(session_id, context=context)
         if not deid_map:
-            from datetime import datetime, timedelta, timezone
-
+            # Validated construction is deliberate: pydantic-core validates these few fields
+            # faster than the pure-Python model_construct() path fills in defaults.
+            # One clock read serves both timestamps, so the lifetime is exact.
+            now = datetime.now(timezone.utc)
             deid_map = DeIdentificationMap(
                 session_id=session_id,
-                expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+                created_at=now,
+                expires_at=now + _MAP_LIFETIME,
             )
+        return deid_map
+
+    def _apply(
+        self,
+        text: str,
+        results: List[RecognizerResult],
+        policy: AegisPolicy,
+        deid_map: DeIdentificationMap,
+    ) -> str:
+        """Rewrites one text, recording any new tokens in `deid_map` (which is not saved)."""
+        if not results:
+            # Nothing detected: there are no spans to sort, filter or splice.
+            return text
 
         # Sort results by start index ascending for deterministic token assignment
         # (Person appearing first gets A, second gets B...)
         # Also handle overlap: If two entities overlap, we must pick one.
-        # We sort by start ASC, then by length DESC to prefer longer matches if they start at same position.
-        sorted_results_asc = sorted(results, key=lambda x: (x.start, -(x.end - x.start)))
-
-        # Filter overlaps
-        filtered_results: List[RecognizerResult] = []
-        last_end = -1
-        for res in sorted_results_asc:
-            if res.start >= last_end:
-                filtered_results.append(res)
-                last_end = res.end
-            else:
-                # This result overlaps with the previous one. Skip it.
-                pass
-
-        # Reverse lookup: Real Value -> Token
-        real_to_token: Dict[str, str] = {v: k for k, v in deid_map.mappings.items()}
-
-        # Pass 1: Assign tokens
-        # We store the determined replacement for each result to apply later
+        # We sort by start ASC, then by length DESC to prefer longer matches if they start at same position;
+        # the input index keeps ties in their original order.
+        # Results are flattened into plain tuples once, so sorting compares tuples natively and the
+        # loop below reads locals instead of RecognizerResult attributes.
+        spans = sorted((r.start, r.start - r.end, i, r.end, r.entity_type) for i, r in enumerate(results))
+
+        # Allow-list entries are exact matches, so a hash set gives O(1) membership per entity.
+        allowed = frozenset(policy.allow_list)
+        # Resolve the redaction strategy once per call; unknown modes fall back to MASK.
+        replace = self._replacers.get(policy.mode, self._replace_mask)
+
+        # Pass 1: Walk the sorted spans once, dropping overlaps and assigning tokens.
+        # A span is kept only if it starts after the previous kept span ends; an allow-listed
+        # span still claims its range, so entities nested inside it are not redacted either.
         replacements: List[Tuple[int, int, str]] = []
+        last_end = -1
+        for start, _, _, end, entity_type in spans:
+            if start < last_end:
+                continue
+            last_end = end
 
-        for result in filtered_results:
-            entity_text = text[result.start : result.end]
+            entity_text = text[start:end]
 
-            # Check policy Allow List
-            if entity_text in policy.allow_list:
+            # Check policy Allow List (skipped entirely when it is empty, so the usual
+            # no-allow-list path never hashes the entity text)
+            if allowed and entity_text in allowed:
                 continue
 
-            # Determine token prefix
-            token_prefix = self._normalize_entity_type(result.entity_type)
-
-            replacement = ""
-            if policy.mode == RedactionMode.MASK:
-                replacement = f"[{token_prefix}]"
-            elif policy.mode == RedactionMode.REPLACE:
-                if entity_text in real_to_token:
-                    replacement = real_to_token[entity_text]
-                else:
-                    # Generate new token
-                    existing_count = sum(1 for t in deid_map.mappings.keys() if t.startswith(f"[{token_prefix}_"))
-                    suffix = self._generate_suffix(existing_count)
-                    replacement = f"[{token_prefix}_{suffix}]"
-
-                    # Update maps
-                    deid_map.mappings[replacement] = entity_text
-                    real_to_token[entity_text] = replacement
-            elif policy.mode == RedactionMode.SYNTHETIC:
-                # Deterministic synthetic replacement
-                replacement = self._get_synthetic_replacement(entity_text, result.entity_type)
-            elif policy.mode == RedactionMode.HASH:
-                # Deterministic HASH replacement
-                # Use SHA-256 and return hex digest
-                replacement = hashlib.sha256(entity_text.encode("utf-8")).hexdigest()
-            else:
-                replacement = f"[{token_prefix}]"  # pragma: no cover
-
-            replacements.append((result.start, result.end, replacement))
+            replacements.append((start, end, replace(entity_text, entity_type, deid_map)))
 
         # Pass 2: Apply replacements
-        # We must apply from end to start to avoid index shifting
-        # Sort replacements by start index descending
-        replacements.sort(key=lambda x: x[0], reverse=True)
+        return _splice(text, replacements)
 
-        masked_text = text
-        for start, end, repl in replacements:
-            masked_text = masked_text[:start] + repl + masked_text[end:]
+    def _replace_mask(self, entity_text: str, entity_type: str, deid_map: DeIdentificationMap) -> str:
+        """MASK mode: replaces the entity with its generic type token (e.g. "[PATIENT]")."""
+        return _mask_token(entity_type)
 
-        # Save updated map (Only relevant for REPLACE mode,
-        # but saving is harmless/idempotent for others if mapping didn't change)
-        self.vault.save_map(deid_map, context=context)
+    def _replace_token(self, entity_text: str, entity_type: str, deid_map: DeIdentificationMap) -> str:
+        """REPLACE mode: replaces the entity with a session-consistent token (e.g. "[PATIENT_A]").
 
-        return masked_text, deid_map
+        Values already seen in the session reuse their token; new values get the next
+        suffix for their prefix and are recorded in the map.
+        """
+        existing_token = deid_map.token_for(entity_text)
+        if existing_token is not None:
+            return existing_token
 
-    def _get_synthetic_replacement(self, text: str, entity_type: str) -> str:
+        # Generate new token
+        replacement = _indexed_token(entity_type, deid_map.token_count(_token_stem(entity_type)))
+
+        # Update map (and its reverse index)
+        deid_map.add_mapping(replacement, entity_text)
+        return replacement
+
+    def _replace_synthetic(self, entity_text: str, entity_type: str, deid_map: DeIdentificationMap) -> str:
+        """SYNTHETIC mode: replaces the entity with deterministic fake data."""
+        return self._synthetic_cache(_synthetic_seed(entity_text), len(entity_text), entity_type)
+
+    def _synthesize(self, seed: int, length: int, entity_type: str) -> str:
+        """Generates a synthetic value while holding the Faker lock (backs the synthetic cache)."""
+        with self._faker_lock:
+            return self._get_synthetic_replacement(seed, length, entity_type)
+
+    def _replace_hash(self, entity_text: str, entity_type: str, deid_map: DeIdentificationMap) -> str:
+        """HASH mode: replaces the entity with the hex SHA-256 digest of its UTF-8 text."""
+        return _sha256_hex(entity_text)
+
+    def _get_synthetic_replacement(self, seed: int, length: int, entity_type: str) -> str:
         """Generates a deterministic synthetic value using Faker.
 
         Args:
-            text: The original entity text (used as seed).
+            seed: The Faker seed derived from the original entity text (see _synthetic_seed).
+            length: The length of the original entity text.
             entity_type: The type of the entity (determines Faker provider).
 
         Returns:
             A string containing the synthetic replacement.
         """
-        # Hash the input text to seed Faker
-        # Use hashlib.sha256 for consistency
-        hash_object = hashlib.sha256(text.encode("utf-8"))
-        # Convert hash to integer for seeding
-        seed_val = int(hash_object.hexdigest(), 16)
-
         # Faker.seed() is global, which is thread-unsafe and bad practice if used globally.
         # However, Faker instances can be seeded individually if we use the generator correctly.
         # The standard Faker class proxies to a generator.
         # self.faker.seed_instance(seed_val) is the correct way for the instance.
-        self.faker.seed_instance(seed_val)
-
-        if entity_type == "PERSON":
-            return cast(str, cast(Any, self.faker.name()))
-        elif entity_type == "EMAIL_ADDRESS":
-            return cast(str, cast(Any, self.faker.email()))
-        elif entity_type == "PHONE_NUMBER":
-            return cast(str, cast(Any, self.faker.phone_number()))
-        elif entity_type == "IP_ADDRESS":
-            return cast(str, cast(Any, self.faker.ipv4()))
-        elif entity_type == "DATE_TIME":
-            return cast(str, cast(Any, self.faker.date()))
-        elif entity_type == "MRN":
-            # 6-10 digits
-            # We'll pick 8 digits as a safe default
-            return str(self.faker.random_number(digits=8, fix_len=True))
-        elif entity_type == "PROTOCOL_ID":
-            # [A-Z]{3}-\d{3}
-            # Faker doesn't have a direct provider for this, so we build it.
-            # Use random_uppercase_letter and random_number
-            letters = "".join(self.faker.random_letters(length=3)).upper()
-            digits = str(self.faker.random_number(digits=3, fix_len=True))
-            return f"{letters}-{digits}"
-        elif entity_type == "LOT_NUMBER":
-            # LOT-[A-Z0-9]+
-            # Let's generate LOT-[A-Z]{2}\d{2} for simplicity and realism
-            suffix_part = "".join(self.faker.random_letters(length=2)).upper()
-            digits_part = str(self.faker.random_number(digits=2, fix_len=True))
-            return f"LOT-{suffix_part}{digits_part}"
-        elif entity_type == "GENE_SEQUENCE":
-            # Sequence of ATCG.
-            # Match length of input if possible? Or just fixed?
-            # Input text is passed to this method.
-            # Let's try to match the length of the original text, or default to 10 if too short.
-            length = max(len(text), 10)
-            # Efficiently generate sequence
-            # random.choices is not seeded by faker.seed_instance?
-            # Faker has random_choices or similar.
-            # Actually, self.faker.random.choices works and uses the seeded random instance.
-            bases = ["A", "T", "C", "G"]
-            return "".join(self.faker.random_elements(elements=bases, length=length, unique=False))
-        elif entity_type == "CHEMICAL_CAS":
-            # \d{2,7}-\d{2}-\d
-            # Let's generate roughly: 5 digits - 2 digits - 1 digit
-            part1 = str(self.faker.random_number(digits=5, fix_len=True))
-            part2 = str(self.faker.random_number(digits=2, fix_len=True))
-            part3 = str(self.faker.random_digit())
-            return f"{part1}-{part2}-{part3}"
-        elif entity_type == "SECRET_KEY":
-            # sk-[A-Za-z0-9]{20,}
-            # Generate 24 chars suffix
-            # random_letters might return only letters. We want alphanumeric.
-            # random_elements with string.ascii_letters + digits is better.
-            chars = string.ascii_letters + string.digits
-            suffix = "".join(self.faker.random_elements(elements=list(chars), length=24, unique=False))
-            return f"sk-{suffix}"
-
-        else:
+        self.faker.seed_instance(seed)
+
+        synthesize = self._synthesizers.get(entity_type)
+        if synthesize is None:
             # Fallback for unknown standard ones
             # Use a generic word
             return cast(str, cast(Any, self.faker.word()))
+        return synthesize(length)
+
+    def _synthetic_person(self, length: int) -> str:
+        """Synthesizes a PERSON value."""
+        return cast(str, cast(Any, self.faker.name()))
+
+    def _synthetic_email(self, length: int) -> str:
+        """Synthesizes an EMAIL_ADDRESS value."""
+        return cast(str, cast(Any, self.faker.email()))
+
+    def _synthetic_phone(self, length: int) -> str:
+        """Synthesizes a PHONE_NUMBER value."""
+        return cast(str, cast(Any, self.faker.phone_number()))
+
+    def _synthetic_ip(self, length: int) -> str:
+        """Synthesizes an IP_ADDRESS value."""
+        return cast(str, cast(Any, self.faker.ipv4()))
+
+    def _synthetic_date(self, length: int) -> str:
+        """Synthesizes a DATE_TIME value."""
+        return cast(str, cast(Any, self.faker.date()))
+
+    def _synthetic_mrn(self, length: int) -> str:
+        """Synthesizes an MRN value."""
+        # 6-10 digits
+        # We'll pick 8 digits as a safe default
+        return str(self.faker.random_number(digits=8, fix_len=True))
+
+    def _synthetic_protocol_id(self, length: int) -> str:
+        """Synthesizes a PROTOCOL_ID value."""
+        # [A-Z]{3}-\d{3}
+        # Faker doesn't have a direct provider for this, so we build it.
+        # Use random_uppercase_letter and random_number
+        letters = "".join(self.faker.random_letters(length=3)).upper()
+        digits = str(self.faker.random_number(digits=3, fix_len=True))
+        return f"{letters}-{digits}"
+
+    def _synthetic_lot_number(self, length: int) -> str:
+        """Synthesizes a LOT_NUMBER value."""
+        # LOT-[A-Z0-9]+
+        # Let's generate LOT-[A-Z]{2}\d{2} for simplicity and realism
+        suffix_part = "".join(self.faker.random_letters(length=2)).upper()
+        digits_part = str(self.faker.random_number(digits=2, fix_len=True))
+        return f"LOT-{suffix_part}{digits_part}"
+
+    def _synthetic_gene_sequence(self, length: int) -> str:
+        """Synthesizes a GENE_SEQUENCE value at least as long as the original."""
+        # Sequence of ATCG.
+        # Let's try to match the length of the original text, or default to 10 if too short.
+        length = max(length, 10)
+        # One randbytes() draw from the seeded random instance, mapped through a
+        # byte -> base table, instead of one Python-level choice per base.
+        return cast(bytes, self.faker.random.randbytes(length)).translate(_GENE_BASES).decode("ascii")
+
+    def _synthetic_cas(self, length: int) -> str:
+        """Synthesizes a CHEMICAL_CAS value."""
+        # \d{2,7}-\d{2}-\d
+        # Let's generate roughly: 5 digits - 2 digits - 1 digit
+        part1 = str(self.faker.random_number(digits=5, fix_len=True))
+        part2 = str(self.faker.random_number(digits=2, fix_len=True))
+        part3 = str(self.faker.random_digit())
+        return f"{part1}-{part2}-{part3}"
+
+    def _synthetic_secret_key(self, length: int) -> str:
+        """Synthesizes a SECRET_KEY value."""
+        # sk-[A-Za-z0-9]{20,}
+        # Generate 24 chars suffix
+        # random_letters might return only letters. We want alphanumeric.
+        # random_elements with string.ascii_letters + digits is better.
+        suffix = "".join(self.faker.random_elements(elements=_SECRET_KEY_ALPHABET, length=24, unique=False))
+        return f"sk-{suffix}"
 
     @staticmethod
     def _normalize_entity_type(entity_type: str) -> str:
@@ -246,9 +469,8 @@ class MaskingEngine:
         EMAIL_ADDRESS -> EMAIL
         PHONE_NUMBER -> PHONE
         IP_ADDRESS -> IP
-        SECRET_KEY -> KEY
         PERSON -> PATIENT
-        LOCATION -> LOCATION (preserved)
+        Any other type (e.g. LOCATION, SECRET_KEY) -> preserved
 
         Args:
             entity_type: The raw entity type from Presidio.
@@ -256,21 +478,7 @@ class MaskingEngine:
         Returns:
             The normalized token string.
         """
-        if entity_type == "PERSON":
-            return "PATIENT"
-        elif entity_type == "DATE_TIME":
-            return "DATE"
-        elif entity_type == "EMAIL_ADDRESS":
-            return "EMAIL"
-        elif entity_type == "PHONE_NUMBER":
-            return "PHONE"
-        elif entity_type == "IP_ADDRESS":
-            return "IP"
-        elif entity_type == "SECRET_KEY":
-            return "SECRET_KEY"
-        elif entity_type == "LOCATION":
-            return "LOCATION"
-        return entity_type
+        return _ENTITY_TOKEN_PREFIXES.get(entity_type, entity_type)
 
     @staticmethod
     def _generate_suffix(count: int) -> str:
@@ -281,6 +489,9 @@ class MaskingEngine:
         25 -> Z
         26 -> AA
 
+        Suffixes up to ZZ come from a precomputed table; larger counts are computed once
+        and memoized.
+
         Args:
             count: The index to convert.
 
@@ -292,13 +503,6 @@ class MaskingEngine:
         """
         if count < 0:
             raise ValueError("Count must be non-negative")
-
-        n = count
-        result = ""
-        while True:
-            n, r = divmod(n, 26)
-            result = chr(65 + r) + result
-            if n == 0:
-                break
-            n -= 1
-        return result
+        if count < _SUFFIX_TABLE_SIZE:
+            return _SUFFIX_TABLE[count]
+        return _compute_suffix(count)
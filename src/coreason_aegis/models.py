@@ -14,11 +14,78 @@ This module defines the core data structures used throughout the Aegis system,
 including policy configuration and de-identification mapping state.
 """
 
+import itertools
+import re
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Self, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+# A bracketed run without nested brackets. Any token of this shape is matched exactly
+# wherever it occurs, because a match always ends at the first closing bracket.
+_BRACKETED_TOKEN = re.compile(r"\[[^\[\]]+\]")
+
+# Source of mapping versions. Shared by every _VersionedDict, so a version number never
+# repeats across dicts and a cache cannot mistake a replaced dict for the one it was built from.
+_MAPPING_VERSIONS = itertools.count()
+
+
+class _VersionedDict(Dict[str, str]):
+    """A dict that takes a new, process-unique version number on every mutation.
+
+    Caches derived from DeIdentificationMap.mappings compare the version they were built
+    for against the current one, so any edit (including replacing a value in place,
+    which leaves the size unchanged) invalidates them.
+    """
+
+    version: int = -1
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._touch()
+
+    def _touch(self) -> None:
+        self.version = next(_MAPPING_VERSIONS)
+
+    def __setitem__(self, key: str, value: str, /) -> None:
+        super().__setitem__(key, value)
+        self._touch()
+
+    def __delitem__(self, key: str, /) -> None:
+        super().__delitem__(key)
+        self._touch()
+
+    if not TYPE_CHECKING:
+        # Kept out of type checking: no override can match both dict.__ior__ and
+        # dict.__or__ (typeshed's own dict.__ior__ needs an ignore for the same reason).
+        def __ior__(self, other: Any, /) -> Self:
+            super().__ior__(other)
+            self._touch()
+            return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+    def pop(self, key: str, /, *default: Any) -> Any:
+        value = super().pop(key, *default)
+        self._touch()
+        return value
+
+    def popitem(self) -> Tuple[str, str]:
+        item = super().popitem()
+        self._touch()
+        return item
+
+    def setdefault(self, key: str, default: Any = None, /) -> Any:
+        value = super().setdefault(key, default)
+        self._touch()
+        return value
+
+    def update(self, *args: Any, **kwargs: str) -> None:
+        super().update(*args, **kwargs)
+        self._touch()
 
 
 class RedactionMode(str, Enum):
@@ -76,7 +143,151 @@ class DeIdentificationMap(BaseModel):
         expires_at: Timestamp when this map should be evicted.
     """
 
+    # Assignments go through validation too, so `mappings` is always a _VersionedDict.
+    model_config = ConfigDict(validate_assignment=True)
+
     session_id: str
     mappings: Dict[str, str] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     expires_at: datetime
+
+    # Reverse index (real value -> token). Kept alongside the map so that repeated
+    # masking calls within a session do not have to invert `mappings` every time.
+    _reverse: Dict[str, str] = PrivateAttr(default_factory=dict)
+    # Version of `mappings` each cache below was built for (see _VersionedDict); a
+    # cache is rebuilt whenever `mappings` has changed since, however it was edited.
+    _reverse_version: int = PrivateAttr(default=-1)
+    # Compiled token alternation used by re-identification; rebuilt only after edits.
+    _token_regex: Optional["re.Pattern[str]"] = PrivateAttr(default=None)
+    _token_regex_version: int = PrivateAttr(default=-1)
+    # Number of tokens per stem (e.g. "[PATIENT_" -> 2), so allocating the next token
+    # suffix does not require scanning every token in the session.
+    _stem_counts: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _stem_counts_version: int = PrivateAttr(default=-1)
+
+    @field_validator("mappings")
+    @classmethod
+    def _version_mappings(cls, mappings: Dict[str, str]) -> Dict[str, str]:
+        """Stores `mappings` as a _VersionedDict, so any later edit invalidates the caches below.
+
+        As with any validated field, the map keeps a copy: editing a dict after passing or
+        assigning it does not change the map. Edit `deid_map.mappings` itself instead.
+        """
+        return _VersionedDict(mappings)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Builds the reverse index and token counters from the initial mappings."""
+        self._rebuild_reverse()
+        self._rebuild_stem_counts()
+
+    def _versioned_mappings(self) -> _VersionedDict:
+        """Returns `mappings`, first wrapping it in a _VersionedDict if it is a plain dict.
+
+        Validation already does the wrapping; only model_construct() and model_copy(update=...)
+        skip it. Writing the wrapper straight into __dict__ keeps it out of fields_set.
+        """
+        mappings = self.mappings
+        if not isinstance(mappings, _VersionedDict):
+            mappings = _VersionedDict(mappings)
+            self.__dict__["mappings"] = mappings
+        return mappings
+
+    def _rebuild_reverse(self) -> None:
+        """Rebuilds the value -> token index from `mappings`."""
+        mappings = self._versioned_mappings()
+        self._reverse = {v: k for k, v in mappings.items()}
+        self._reverse_version = mappings.version
+
+    @staticmethod
+    def _stem_of(token: str) -> str:
+        """Returns the stem of a token: everything up to its last underscore ("[PATIENT_A]" -> "[PATIENT_")."""
+        return token[: token.rfind("_") + 1]
+
+    def _rebuild_stem_counts(self) -> None:
+        """Recounts tokens per stem from `mappings`."""
+        mappings = self._versioned_mappings()
+        counts: Dict[str, int] = {}
+        for token in mappings:
+            stem = self._stem_of(token)
+            counts[stem] = counts.get(stem, 0) + 1
+        self._stem_counts = counts
+        self._stem_counts_version = mappings.version
+
+    def token_count(self, stem: str) -> int:
+        """Returns how many tokens with the given stem (e.g. "[PATIENT_") the map holds.
+
+        Args:
+            stem: The token stem, i.e. the token up to and including its last underscore.
+
+        Returns:
+            The number of tokens sharing the stem.
+        """
+        if self._stem_counts_version != self._versioned_mappings().version:
+            # `mappings` was edited directly rather than via add_mapping(); recount.
+            self._rebuild_stem_counts()
+        return self._stem_counts.get(stem, 0)
+
+    def token_pattern(self) -> "re.Pattern[str]":
+        """Returns a compiled pattern matching every token in the map.
+
+        Tokens of the usual bracketed shape (e.g. "[PATIENT_A]") are found with one
+        generic pattern, so nothing has to be compiled per session; callers look each
+        match up in `mappings` and leave unknown ones unchanged. If any token has another
+        shape, a longest-first alternation of the tokens is compiled instead, so that a
+        token never matches as a prefix of a longer one (e.g. "[A]" inside "[AA]"). The
+        choice is cached on the map and only revisited after `mappings` changes.
+
+        Returns:
+            A pattern whose matches include every occurrence of every token.
+        """
+        mappings = self._versioned_mappings()
+        pattern = self._token_regex
+        if pattern is None or self._token_regex_version != mappings.version:
+            tokens = list(mappings)
+            if all(_BRACKETED_TOKEN.fullmatch(token) for token in tokens):
+                pattern = _BRACKETED_TOKEN
+            else:
+                ordered = sorted(tokens, key=len, reverse=True)
+                pattern = re.compile("|".join(map(re.escape, ordered)))
+            self._token_regex = pattern
+            self._token_regex_version = mappings.version
+        return pattern
+
+    def token_for(self, value: str) -> Optional[str]:
+        """Returns the token already assigned to a real value, if any.
+
+        Args:
+            value: The original (real) value.
+
+        Returns:
+            The token mapped to the value, or None if the value has no token yet.
+        """
+        if self._reverse_version != self._versioned_mappings().version:
+            # `mappings` was edited directly rather than via add_mapping(); resync.
+            self._rebuild_reverse()
+        return self._reverse.get(value)
+
+    def add_mapping(self, token: str, value: str) -> None:
+        """Records a token -> real value mapping and keeps the reverse index in sync.
+
+        Args:
+            token: The redaction token (e.g., "[PATIENT_A]").
+            value: The original value the token stands for.
+        """
+        mappings = self._versioned_mappings()
+        version = mappings.version
+        previous = mappings.get(token)
+        mappings[token] = value
+        # Caches that were current before this edit are updated in place; stale ones
+        # are left for the next lookup to rebuild.
+        if self._stem_counts_version == version:
+            if previous is None:
+                stem = self._stem_of(token)
+                self._stem_counts[stem] = self._stem_counts.get(stem, 0) + 1
+            self._stem_counts_version = mappings.version
+        if self._reverse_version == version:
+            if previous is not None and self._reverse.get(previous) == token:
+                # The token is being re-pointed; its old value no longer maps to it.
+                del self._reverse[previous]
+            self._reverse[value] = token
+            self._reverse_version = mappings.version
@@ -70,28 +70,11 @@ class ReIdentifier:
             # If not authorized, return tokens as is.
             return text
 
-        # Replace tokens with real values.
-        # We need to scan for tokens.
-        # Since tokens are in the map, we can iterate the map.
-        # However, simple string replacement might be dangerous if tokens are substrings of others
-        # (though our tokens have brackets like [PATIENT_A], which helps).
-        # Better approach: Regex replacement for all keys in map.
-
-        # Optimization: Build a single regex pattern from all keys?
-        # keys are like [PATIENT_A], [EMAIL_A]...
-        # Escape keys for regex.
-
         if not deid_map.mappings:
             return text
 
-        # Sort keys by length descending to avoid prefix matching issues
-        sorted_keys = sorted(deid_map.mappings.keys(), key=len, reverse=True)
-
-        # We can iterate and replace.
-        result_text = text
-        for token in sorted_keys:
-            real_value = deid_map.mappings[token]
-            # Simple replace is O(N*M), but fine for typical text sizes.
-            result_text = result_text.replace(token, real_value)
-
-        return result_text
+        # Replace tokens with real values in a single pass over the text.
+        # The pattern may also match bracketed text that is not a token of this
+        # session; such matches are left as they are.
+        mappings = deid_map.mappings
+        return deid_map.token_pattern().sub(lambda match: mappings.get(match.group(0), match.group(0)), text)
@@ -15,21 +15,171 @@ AnalyzerEngine to detect sensitive entities in text. It includes custom
 recognizers for specific domains like Pharma and Security.
 """
 
-from typing import Any, List, Optional, cast
+import copy
+import hashlib
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, Sequence, Tuple, cast
 
+from cachetools import TTLCache
 from coreason_identity.models import UserContext
-from presidio_analyzer import AnalyzerEngine, Pattern, PatternRecognizer, RecognizerResult
+from presidio_analyzer import (
+    AnalysisExplanation,
+    AnalyzerEngine,
+    BatchAnalyzerEngine,
+    EntityRecognizer,
+    Pattern,
+    RecognizerResult,
+)
+from presidio_analyzer.nlp_engine import NerModelConfiguration, NlpEngineProvider, SpacyNlpEngine
 
 from coreason_aegis.models import AegisPolicy
 from coreason_aegis.utils.logger import logger
 
 _ANALYZER_ENGINE_CACHE: Optional[AnalyzerEngine] = None
+_ANALYZER_ENGINE_LOCK = threading.Lock()
+
+# Scan memoization is opt-in: a Scanner only caches results when given a cache size.
+# Entries expire after the same default lifetime as a VaultManager mapping.
+DEFAULT_SCAN_CACHE_TTL = 3600
+
+# Number of texts handed to the spaCy pipeline at once by Scanner.scan_batch.
+DEFAULT_BATCH_SIZE = 32
+
+_ScanKey = Tuple[bytes, Tuple[str, ...], float, Tuple[str, ...], int]
+_ScanCache = MutableMapping[_ScanKey, Tuple[RecognizerResult, ...]]
+
+# spaCy model backing the NER pipeline. en_core_web_lg (Presidio's default) ships
+# ~600MB of word vectors; en_core_web_sm has none and loads far faster at a small
+# accuracy cost. Override with the AEGIS_NER_MODEL environment variable.
+DEFAULT_NER_MODEL = "en_core_web_lg"
+
+
+def get_ner_model() -> str:
+    """Returns the spaCy model name configured for NER.
+
+    Returns:
+        The value of AEGIS_NER_MODEL, or DEFAULT_NER_MODEL if unset.
+    """
+    return os.environ.get("AEGIS_NER_MODEL", DEFAULT_NER_MODEL)
+
+
+def _create_nlp_engine(model_name: str) -> SpacyNlpEngine:
+    """Creates (without loading) a spaCy NLP engine for the given model.
+
+    Presidio's default NER configuration (entity mapping, ignored labels) is kept;
+    only the model is swapped. The AnalyzerEngine loads the model on construction.
+
+    Args:
+        model_name: The spaCy model package name (e.g., "en_core_web_sm").
+
+    Returns:
+        An unloaded SpacyNlpEngine.
+    """
+    default_configuration = NlpEngineProvider().nlp_configuration
+    return SpacyNlpEngine(
+        models=[{"lang_code": "en", "model_name": model_name}],
+        ner_model_configuration=NerModelConfiguration.from_dict(default_configuration["ner_model_configuration"]),
+    )
+
+
+# Presidio's PatternRecognizer matches with these flags by default; keep parity.
+_CUSTOM_PATTERN_FLAGS = re.DOTALL | re.MULTILINE | re.IGNORECASE
+
+# Custom domain entities and their patterns.
+_CUSTOM_PATTERNS: Tuple[Tuple[str, Pattern], ...] = (
+    # API_KEY: OpenAI or similar API keys starting with sk-
+    # Regex: \bsk-[a-zA-Z0-9-]{20,}\b (Matches sk- followed by at least 20 alphanumeric/hyphen chars)
+    ("SECRET_KEY", Pattern(name="api_key_pattern", regex=r"\bsk-[a-zA-Z0-9-]{20,}\b", score=0.95)),
+    # LOT_NUMBER: LOT-[alphanumeric]
+    ("LOT_NUMBER", Pattern(name="lot_pattern", regex=r"\bLOT-[A-Z0-9]+\b", score=0.85)),
+    # PROTOCOL_ID: 3 letters dash 3 numbers
+    ("PROTOCOL_ID", Pattern(name="protocol_pattern", regex=r"\b[A-Z]{3}-\d{3}\b", score=0.85)),
+    # CHEMICAL_CAS: CAS Registry Numbers (e.g., 50-00-0)
+    # Regex: \b\d{2,7}-\d{2}-\d\b
+    ("CHEMICAL_CAS", Pattern(name="cas_pattern", regex=r"\b\d{2,7}-\d{2}-\d\b", score=0.85)),
+    # MRN: Medical Record Number (6-10 digits)
+    ("MRN", Pattern(name="mrn_pattern", regex=r"\b\d{6,10}\b", score=0.85)),
+    # GENE_SEQUENCE: DNA sequences (e.g., ATCGATCGAT)
+    # Regex: \b[ATCG]{10,}\b (Matches sequences of length 10 or more)
+    ("GENE_SEQUENCE", Pattern(name="gene_pattern", regex=r"\b[ATCG]{10,}\b", score=0.85)),
+)
+
+
+class CustomPatternRecognizer(EntityRecognizer):  # type: ignore[misc, unused-ignore]
+    """Detects all custom regex entities with a single registered recognizer.
+
+    Registering one PatternRecognizer per entity makes Presidio run a recognizer per
+    pattern. This recognizer instead compiles every pattern once and runs only the
+    ones requested by the policy. Each pattern is matched on its own, so overlapping
+    matches of different entities (e.g. a PROTOCOL_ID running into a CHEMICAL_CAS)
+    are all reported: if Presidio later drops one through the allow list or the score
+    threshold, the other still covers its span.
+    """
+
+    name: str
+
+    def __init__(self, patterns: Sequence[Tuple[str, Pattern]] = _CUSTOM_PATTERNS) -> None:
+        """Initializes the recognizer.
+
+        Args:
+            patterns: (entity_type, Pattern) pairs to detect.
+        """
+        self._patterns: Dict[str, Pattern] = dict(patterns)
+        self._compiled: Dict[str, re.Pattern[str]] = {
+            entity: re.compile(pattern.regex, _CUSTOM_PATTERN_FLAGS) for entity, pattern in self._patterns.items()
+        }
+        super().__init__(supported_entities=list(self._patterns), name="CustomPatternRecognizer")
+
+    def load(self) -> None:
+        """No external resources to load."""
+
+    def analyze(self, text: str, entities: List[str], nlp_artifacts: Any = None) -> List[RecognizerResult]:
+        """Analyzes the text for the requested custom entities.
+
+        Args:
+            text: The text to analyze.
+            entities: The entity types requested by the caller.
+            nlp_artifacts: Unused; present for the EntityRecognizer interface.
+
+        Returns:
+            A list of RecognizerResult objects, one per match.
+        """
+        results: List[RecognizerResult] = []
+        for entity_type, pattern in self._patterns.items():
+            if entity_type not in entities:
+                continue
+            for match in self._compiled[entity_type].finditer(text):
+                results.append(self._result(entity_type, pattern, match))
+        return results
+
+    def _result(self, entity_type: str, pattern: Pattern, match: "re.Match[str]") -> RecognizerResult:
+        """Builds the RecognizerResult for one pattern match."""
+        return RecognizerResult(
+            entity_type=entity_type,
+            start=match.start(),
+            end=match.end(),
+            score=pattern.score,
+            analysis_explanation=AnalysisExplanation(
+                recognizer=self.name,
+                original_score=pattern.score,
+                pattern_name=pattern.name,
+                pattern=pattern.regex,
+                textual_explanation=f"Detected by `{self.name}` using pattern `{pattern.name}`",
+            ),
+            recognition_metadata={
+                RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+                RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+            },
+        )
 
 
 def _load_custom_recognizers(analyzer: AnalyzerEngine) -> None:
     """Loads and registers custom entity recognizers into the Presidio analyzer.
 
-    Registers recognizers for:
+    Registers a single CustomPatternRecognizer covering:
     - MRN: Medical Record Number (6-10 digits)
     - PROTOCOL_ID: 3 letters, dash, 3 numbers
     - LOT_NUMBER: 'LOT-' followed by alphanumeric
@@ -40,38 +190,7 @@ def _load_custom_recognizers(analyzer: AnalyzerEngine) -> None:
     Args:
         analyzer: The Presidio AnalyzerEngine instance to update.
     """
-    # MRN: Medical Record Number (6-10 digits)
-    mrn_pattern = Pattern(name="mrn_pattern", regex=r"\b\d{6,10}\b", score=0.85)
-    mrn_recognizer = PatternRecognizer(supported_entity="MRN", patterns=[mrn_pattern])
-    analyzer.registry.add_recognizer(mrn_recognizer)
-
-    # PROTOCOL_ID: 3 letters dash 3 numbers
-    protocol_pattern = Pattern(name="protocol_pattern", regex=r"\b[A-Z]{3}-\d{3}\b", score=0.85)
-    protocol_recognizer = PatternRecognizer(supported_entity="PROTOCOL_ID", patterns=[protocol_pattern])
-    analyzer.registry.add_recognizer(protocol_recognizer)
-
-    # LOT_NUMBER: LOT-[alphanumeric]
-    lot_pattern = Pattern(name="lot_pattern", regex=r"\bLOT-[A-Z0-9]+\b", score=0.85)
-    lot_recognizer = PatternRecognizer(supported_entity="LOT_NUMBER", patterns=[lot_pattern])
-    analyzer.registry.add_recognizer(lot_recognizer)
-
-    # GENE_SEQUENCE: DNA sequences (e.g., ATCGATCGAT)
-    # Regex: \b[ATCG]{10,}\b (Matches sequences of length 10 or more)
-    gene_pattern = Pattern(name="gene_pattern", regex=r"\b[ATCG]{10,}\b", score=0.85)
-    gene_recognizer = PatternRecognizer(supported_entity="GENE_SEQUENCE", patterns=[gene_pattern])
-    analyzer.registry.add_recognizer(gene_recognizer)
-
-    # CHEMICAL_CAS: CAS Registry Numbers (e.g., 50-00-0)
-    # Regex: \b\d{2,7}-\d{2}-\d\b
-    cas_pattern = Pattern(name="cas_pattern", regex=r"\b\d{2,7}-\d{2}-\d\b", score=0.85)
-    cas_recognizer = PatternRecognizer(supported_entity="CHEMICAL_CAS", patterns=[cas_pattern])
-    analyzer.registry.add_recognizer(cas_recognizer)
-
-    # API_KEY: OpenAI or similar API keys starting with sk-
-    # Regex: \bsk-[a-zA-Z0-9-]{20,}\b (Matches sk- followed by at least 20 alphanumeric/hyphen chars)
-    api_key_pattern = Pattern(name="api_key_pattern", regex=r"\bsk-[a-zA-Z0-9-]{20,}\b", score=0.95)
-    api_key_recognizer = PatternRecognizer(supported_entity="SECRET_KEY", patterns=[api_key_pattern])
-    analyzer.registry.add_recognizer(api_key_recognizer)
+    analyzer.registry.add_recognizer(CustomPatternRecognizer())
 
 
 def _get_analyzer_engine() -> AnalyzerEngine:
@@ -84,17 +203,25 @@ def _get_analyzer_engine() -> AnalyzerEngine:
         RuntimeError: If initialization fails.
     """
     global _ANALYZER_ENGINE_CACHE
-    if _ANALYZER_ENGINE_CACHE is None:
-        try:
-            logger.info("Initializing Presidio AnalyzerEngine...")
-            analyzer = AnalyzerEngine()
-            _load_custom_recognizers(analyzer)
-            _ANALYZER_ENGINE_CACHE = analyzer
-            logger.info("Presidio AnalyzerEngine initialized successfully.")
-        except Exception as e:
-            logger.critical(f"Failed to initialize Presidio AnalyzerEngine: {e}")
-            raise RuntimeError(f"Scanner initialization failed: {e}") from e
-    return _ANALYZER_ENGINE_CACHE
+    if _ANALYZER_ENGINE_CACHE is not None:
+        return _ANALYZER_ENGINE_CACHE
+
+    # Double-checked locking: loading the spaCy model takes seconds, so concurrent
+    # first callers must wait for a single initialization instead of racing it.
+    # GPU placement is handled by SpacyNlpEngine.load(), which calls spacy.require_gpu().
+    with _ANALYZER_ENGINE_LOCK:
+        if _ANALYZER_ENGINE_CACHE is None:
+            try:
+                model_name = get_ner_model()
+                logger.info(f"Initializing Presidio AnalyzerEngine with spaCy model {model_name}...")
+                analyzer = AnalyzerEngine(nlp_engine=_create_nlp_engine(model_name))
+                _load_custom_recognizers(analyzer)
+                _ANALYZER_ENGINE_CACHE = analyzer
+                logger.info("Presidio AnalyzerEngine initialized successfully.")
+            except Exception as e:
+                logger.critical(f"Failed to initialize Presidio AnalyzerEngine: {e}")
+                raise RuntimeError(f"Scanner initialization failed: {e}") from e
+        return _ANALYZER_ENGINE_CACHE
 
 
 class Scanner:
@@ -104,15 +231,103 @@ class Scanner:
     sensitive information in text based on a configurable policy.
     """
 
-    def __init__(self) -> None:
-        """Initializes the Scanner."""
-        self._analyzer = _get_analyzer_engine()
+    def __init__(
+        self,
+        analyzer: Optional[AnalyzerEngine] = None,
+        cache_size: int = 0,
+        cache_ttl_seconds: float = DEFAULT_SCAN_CACHE_TTL,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the Scanner.
+
+        Args:
+            analyzer: Optional AnalyzerEngine to use. Defaults to the shared,
+                lazily loaded process-wide engine.
+            cache_size: Maximum number of memoized scan results. Default 0 (no caching).
+            cache_ttl_seconds: Time to live in seconds for each memoized result. Default 1 hour.
+            timer: Timer function for the cache TTL. Defaults to time.monotonic.
+        """
+        self._analyzer = analyzer if analyzer is not None else _get_analyzer_engine()
+        self._batch_analyzer: Optional[BatchAnalyzerEngine] = None
+        # Keyed by a digest of the text, never the text itself, so raw input is not
+        # retained. TTLCache is not thread-safe and scans run from worker threads.
+        self._scan_cache: Optional[_ScanCache] = (
+            TTLCache(maxsize=cache_size, ttl=cache_ttl_seconds, timer=timer) if cache_size > 0 else None
+        )
+        self._cache_lock = threading.Lock()
+        self._recognizers: Tuple[EntityRecognizer, ...] = ()
+        self._registry_generation = 0
 
     @property
     def analyzer(self) -> AnalyzerEngine:
         """Returns the underlying Presidio AnalyzerEngine."""
         return self._analyzer
 
+    @property
+    def batch_analyzer(self) -> BatchAnalyzerEngine:
+        """Returns a BatchAnalyzerEngine sharing the underlying AnalyzerEngine, creating it on first use."""
+        if self._batch_analyzer is None:
+            self._batch_analyzer = BatchAnalyzerEngine(analyzer_engine=self._analyzer)
+        return self._batch_analyzer
+
+    @property
+    def ner_model(self) -> str:
+        """Returns the spaCy model the underlying AnalyzerEngine was built with.
+
+        Unlike get_ner_model(), this reflects the engine actually in use, which may
+        have been created before AEGIS_NER_MODEL changed or injected by the caller.
+        Engines that are not spaCy based report their class name.
+        """
+        nlp_engine = self._analyzer.nlp_engine
+        if isinstance(nlp_engine, SpacyNlpEngine):
+            return str(nlp_engine.models[0]["model_name"])
+        return type(nlp_engine).__name__
+
+    @property
+    def _registry_version(self) -> int:
+        """Returns a counter that advances whenever the registry's recognizers change.
+
+        The recognizers are compared by identity with the last snapshot seen, so adding,
+        removing or swapping one is detected even when the count stays the same. The
+        snapshot keeps them alive, so a dropped recognizer's id() cannot be reused.
+        """
+        recognizers = tuple(cast(List[EntityRecognizer], self._analyzer.registry.recognizers))
+        with self._cache_lock:
+            if list(map(id, recognizers)) != list(map(id, self._recognizers)):
+                self._recognizers = recognizers
+                self._registry_generation += 1
+            return self._registry_generation
+
+    def clear_cache(self) -> None:
+        """Drops all memoized scan results."""
+        if self._scan_cache is not None:
+            with self._cache_lock:
+                self._scan_cache.clear()
+
+    def _cache_key(self, text: str, policy: AegisPolicy) -> _ScanKey:
+        """Builds the memoization key for scanning text under a policy."""
+        return (
+            hashlib.sha256(text.encode("utf-8")).digest(),
+            tuple(policy.entity_types),
+            policy.confidence_score,
+            tuple(policy.allow_list),
+            self._registry_version,
+        )
+
+    def _cache_lookup(self, cache: _ScanCache, key: _ScanKey) -> Optional[List[RecognizerResult]]:
+        """Returns a copy of the memoized results for a key, or None if absent or expired."""
+        with self._cache_lock:
+            cached = cache.get(key)
+        # RecognizerResult is mutable (Presidio and callers adjust scores and spans),
+        # so every caller gets its own instances.
+        return None if cached is None else copy.deepcopy(list(cached))
+
+    def _cache_store(self, cache: _ScanCache, key: _ScanKey, results: Sequence[RecognizerResult]) -> None:
+        """Memoizes a copy of the results for a key."""
+        stored = tuple(copy.deepcopy(list(results)))
+        with self._cache_lock:
+            cache[key] = stored
+
     def scan(self, text: str, policy: AegisPolicy, context: UserContext) -> List[RecognizerResult]:
         """Scans the provided text for entities defined in the policy.
 
@@ -133,18 +348,99 @@ class Scanner:
         if not text:
             return []
 
+        # Scanning is a pure function of the text and the policy fields below for a given
+        # registry, so with caching enabled repeated texts are served from the cache.
+        cache = self._scan_cache
+        if cache is not None:
+            key = self._cache_key(text, policy)
+            cached = self._cache_lookup(cache, key)
+            if cached is not None:
+                return cached
+
         try:
             # Explicitly cast because presidio-analyzer type hints might be loose or Any
-            results = self.analyzer.analyze(
+            analyzed = self.analyzer.analyze(
                 text=text,
                 entities=policy.entity_types,
                 language="en",
                 score_threshold=policy.confidence_score,
                 allow_list=policy.allow_list,
             )
-            return cast(List[RecognizerResult], cast(Any, results))
+            results = cast(List[RecognizerResult], cast(Any, analyzed))
         except Exception as e:
             logger.error(f"Scan failed: {e}")
             # Fail Closed: If scanning fails, we must alert or block.
             # Raising exception effectively blocks the process relying on it.
             raise RuntimeError(f"Scan operation failed: {e}") from e
+
+        if cache is not None:
+            self._cache_store(cache, key, results)
+        return results
+
+    def scan_batch(
+        self,
+        texts: Sequence[str],
+        policy: AegisPolicy,
+        context: UserContext,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[List[RecognizerResult]]:
+        """Scans many texts at once, running the NLP pipeline over them in batches.
+
+        Texts that are empty, repeated within the batch or already memoized are not
+        sent to the analyzer.
+
+        Args:
+            texts: The text strings to scan.
+            policy: The AegisPolicy defining entity types and confidence thresholds.
+            context: The user context for auditing.
+            batch_size: Number of texts processed by the NLP pipeline per batch.
+
+        Returns:
+            One list of RecognizerResult objects per input text, in input order.
+
+        Raises:
+            RuntimeError: If the scan operation fails (Fail Closed principle).
+        """
+        if context is None:
+            raise ValueError("UserContext is required")
+
+        cache = self._scan_cache
+        outputs: List[List[RecognizerResult]] = [[] for _ in texts]
+        pending: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            if not text:
+                continue
+            indices = pending.get(text)
+            if indices is not None:
+                indices.append(index)
+                continue
+            if cache is not None:
+                cached = self._cache_lookup(cache, self._cache_key(text, policy))
+                if cached is not None:
+                    outputs[index] = cached
+                    continue
+            pending[text] = [index]
+
+        if not pending:
+            return outputs
+
+        try:
+            batch_results = self.batch_analyzer.analyze_iterator(
+                list(pending),
+                language="en",
+                batch_size=batch_size,
+                entities=policy.entity_types,
+                score_threshold=policy.confidence_score,
+                allow_list=policy.allow_list,
+            )
+            for (text, indices), results in zip(pending.items(), batch_results, strict=True):
+                if cache is not None:
+                    self._cache_store(cache, self._cache_key(text, policy), results)
+                outputs[indices[0]] = list(results)
+                for index in indices[1:]:
+                    outputs[index] = copy.deepcopy(results)
+        except Exception as e:
+            logger.error(f"Batch scan failed: {e}")
+            # Fail Closed: a partially scanned batch must not reach the masking stage.
+            raise RuntimeError(f"Scan operation failed: {e}") from e
+        return outputs
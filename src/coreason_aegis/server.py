@@ -20,7 +20,9 @@ from typing import Any, Dict, Optional
 from coreason_identity.models import UserContext
 from coreason_identity.types import SecretStr
 from fastapi import FastAPI, HTTPException, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from pydantic_core import to_json
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from coreason_aegis.main import AegisAsync
@@ -41,6 +43,18 @@ class Settings(BaseSettings):  # type: ignore
 settings = Settings()
 
 
+class PydanticJSONResponse(JSONResponse):  # type: ignore[misc]
+    """JSON response rendered by pydantic-core's Rust serializer.
+
+    Produces the same compact UTF-8 output as Starlette's JSONResponse, without
+    a second pass through the stdlib json encoder for every DeIdentificationMap.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serializes the response content to JSON bytes."""
+        return to_json(content)
+
+
 class SanitizeRequest(BaseModel):
     """Request model for sanitization."""
 
@@ -95,7 +109,7 @@ async def lifespan(app: FastAPI) -> Any:
     logger.info("AegisAsync shutdown complete")
 
 
-app = FastAPI(lifespan=lifespan, title="Aegis Privacy Firewall")
+app = FastAPI(lifespan=lifespan, title="Aegis Privacy Firewall", default_response_class=PydanticJSONResponse)
 
 
 @app.post("/sanitize", response_model=SanitizeResponse)
@@ -141,9 +155,11 @@ async def health() -> Dict[str, str]:
 
     try:
         # Check if internal components are ready
-        if app.state.aegis.scanner.analyzer is None:
+        scanner = app.state.aegis.scanner
+        if scanner.analyzer is None:
             raise RuntimeError("Analyzer not initialized")
+        model = scanner.ner_model
     except Exception:
         raise HTTPException(status_code=503, detail="Unhealthy") from None
 
-    return {"status": "protected", "engine": "presidio", "model": "en_core_web_lg"}
+    return {"status": "protected", "engine": "presidio", "model": model}
@@ -26,9 +26,12 @@ __all__ = ["logger"]
 logger.remove()
 
 # Sink 1: Stdout (Human-readable)
+# enqueue=True hands records to a background writer thread, so request threads
+# (e.g. security alerts raised inside sanitize()) never block on terminal I/O.
 logger.add(
     sys.stderr,
     level="INFO",
+    enqueue=True,
     format=(
         "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
         "<level>{level: <8}</level> | "
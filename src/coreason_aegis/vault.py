@@ -15,6 +15,7 @@ mappings between redacted tokens and real values, ensuring data expires
 appropriately.
 """
 
+import threading
 import time
 from typing import Callable, MutableMapping, Optional
 
@@ -49,6 +50,9 @@ class VaultManager:
         self._storage: MutableMapping[str, DeIdentificationMap] = TTLCache(
             maxsize=max_size, ttl=ttl_seconds, timer=timer
         )
+        # TTLCache is not thread-safe (reads also expire entries), and AegisAsync runs
+        # concurrent sanitize/desanitize calls on separate anyio worker threads.
+        self._lock = threading.Lock()
 
     def save_map(self, mapping: DeIdentificationMap, context: UserContext) -> None:
         """Saves or updates a mapping in the vault.
@@ -61,7 +65,8 @@ class VaultManager:
             raise ValueError("UserContext is required")
 
         logger.info("Storing PII mapping", user_id=context.user_id.get_secret_value())
-        self._storage[mapping.session_id] = mapping
+        with self._lock:
+            self._storage[mapping.session_id] = mapping
 
     def get_map(self, session_id: str, context: UserContext) -> Optional[DeIdentificationMap]:
         """Retrieves a mapping by session_id.
@@ -79,7 +84,8 @@ class VaultManager:
 
         logger.info("Retrieving PII mapping", user_id=context.user_id.get_secret_value())
         # TTLCache automatically handles expiration on access (or rather, hides expired items)
-        return self._storage.get(session_id)
+        with self._lock:
+            return self._storage.get(session_id)
 
     def delete_map(self, session_id: str, context: UserContext) -> None:
         """Deletes a mapping from the vault.
@@ -91,5 +97,5 @@ class VaultManager:
         if context is None:
             raise ValueError("UserContext is required")
 
-        if session_id in self._storage:
-            del self._storage[session_id]
+        with self._lock:
+            self._storage.pop(session_id, None)
@@ -1,11 +1,15 @@
+import os
 import sys
 import types
-from typing import Any, Dict, Generator, List
+from typing import TYPE_CHECKING, Any, Dict, Generator, List
 from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import BaseModel, ConfigDict
 
+if TYPE_CHECKING:
+    from coreason_aegis.scanner import Scanner
+
 # --- Mock coreason_identity ---
 
 
@@ -45,6 +49,22 @@ sys.modules["coreason_identity.models"] = mock_models
 # Also patch the root package if needed, but usually specific submodules are enough
 # if imports are from submodules.
 
+# Default the test suite to the small spaCy model: no word vectors, much faster
+# cold-load and lower RSS. Export AEGIS_NER_MODEL=en_core_web_lg to test against
+# the production model.
+os.environ.setdefault("AEGIS_NER_MODEL", "en_core_web_sm")
+
+
+@pytest.fixture(scope="session")
+def scanner() -> "Scanner":
+    # One real Scanner for the whole run: the AnalyzerEngine behind it loads a spaCy
+    # model, so per-test construction is only cheap while the engine cache is warm.
+    # Modules that test Scanner against a mocked engine define their own `scanner`.
+    # Imported here so the coreason_identity mocks above are installed first.
+    from coreason_aegis.scanner import Scanner
+
+    return Scanner()
+
 
 @pytest.fixture
 def mock_context() -> UserContext:
@@ -17,6 +17,12 @@ def test_desanitize_missing_context(mock_scanner_engine: MagicMock) -> None:
         aegis.desanitize("text", "sess", context=None)
 
 
+def test_sanitize_batch_missing_context(mock_scanner_engine: MagicMock) -> None:
+    aegis = Aegis()
+    with pytest.raises(ValueError, match="UserContext is required"):
+        aegis.sanitize_batch(["text"], ["sess"], context=None)
+
+
 @pytest.mark.asyncio
 async def test_sanitize_async_missing_context(mock_scanner_engine: MagicMock) -> None:
     async with AegisAsync() as aegis:
@@ -8,18 +8,12 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_aegis
 
-import pytest
 from coreason_identity.models import UserContext
 
 from coreason_aegis.models import AegisPolicy
 from coreason_aegis.scanner import Scanner
 
 
-@pytest.fixture
-def scanner() -> Scanner:
-    return Scanner()
-
-
 def test_mrn_detection(scanner: Scanner, mock_context: UserContext) -> None:
     text = "Patient has MRN 12345678."
     policy = AegisPolicy(entity_types=["MRN"], confidence_score=0.5)
@@ -281,3 +275,24 @@ def test_api_key_boundary(scanner: Scanner, mock_context: UserContext) -> None:
     detected = [text[r.start : r.end] for r in results]
     assert short_val not in detected
     assert exact_val in detected
+
+
+def test_overlapping_entity_survives_allow_list(scanner: Scanner, mock_context: UserContext) -> None:
+    # "ABC-123" (PROTOCOL_ID) runs into "123-45-6" (CHEMICAL_CAS). Allow-listing the
+    # protocol must not hide the CAS number sharing its digits.
+    text = "Sample ABC-123-45-6 logged."
+    policy = AegisPolicy(entity_types=["PROTOCOL_ID", "CHEMICAL_CAS"], allow_list=["ABC-123"], confidence_score=0.5)
+    results = scanner.scan(text, policy, context=mock_context)
+
+    assert [(r.entity_type, text[r.start : r.end]) for r in results] == [("CHEMICAL_CAS", "123-45-6")]
+
+
+def test_overlapping_entity_survives_score_threshold(scanner: Scanner, mock_context: UserContext) -> None:
+    # "LOT-sk" (LOT_NUMBER, 0.85) overlaps the API key (SECRET_KEY, 0.95). Filtering the
+    # lot number out by score must still leave the key detected.
+    key = "sk-abcdefghij1234567890XY"
+    text = f"Batch LOT-{key} shipped."
+    policy = AegisPolicy(entity_types=["LOT_NUMBER", "SECRET_KEY"], confidence_score=0.9)
+    results = scanner.scan(text, policy, context=mock_context)
+
+    assert [(r.entity_type, text[r.start : r.end]) for r in results] == [("SECRET_KEY", key)]
@@ -17,11 +17,6 @@ from coreason_aegis.models import AegisPolicy
 from coreason_aegis.scanner import Scanner
 
 
-@pytest.fixture
-def scanner() -> Scanner:
-    return Scanner()
-
-
 @pytest.mark.integration
 def test_json_payload_scanning(scanner: Scanner, mock_context: UserContext) -> None:
     """
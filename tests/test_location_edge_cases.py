@@ -10,19 +10,25 @@
 
 import pytest
 from coreason_identity.models import UserContext
+from presidio_analyzer import AnalyzerEngine
 
 from coreason_aegis.main import Aegis
 from coreason_aegis.models import AegisPolicy
-from coreason_aegis.scanner import Scanner
+from coreason_aegis.scanner import Scanner, _create_nlp_engine, _load_custom_recognizers
 
 
-@pytest.fixture
-def scanner() -> Scanner:
-    return Scanner()
+@pytest.fixture(scope="module")
+def lg_scanner() -> Scanner:
+    # Built on en_core_web_lg whatever AEGIS_NER_MODEL selects for the rest of the suite,
+    # so the ambiguity check below always runs against the production model.
+    analyzer = AnalyzerEngine(nlp_engine=_create_nlp_engine("en_core_web_lg"))
+    _load_custom_recognizers(analyzer)
+    return Scanner(analyzer=analyzer)
 
 
 @pytest.mark.integration
-def test_ambiguous_location_vs_name(scanner: Scanner, mock_context: UserContext) -> None:
+@pytest.mark.lg
+def test_ambiguous_location_vs_name(lg_scanner: Scanner, mock_context: UserContext) -> None:
     """
     Test differentiation between ambiguous names that are also locations.
     e.g., "Washington" (Name) vs "Washington" (Location).
@@ -30,7 +36,7 @@ def test_ambiguous_location_vs_name(scanner: Scanner, mock_context: UserContext)
     """
     text = "George Washington visited Washington."
     policy = AegisPolicy(entity_types=["PERSON", "LOCATION"], confidence_score=0.4)
-    results = scanner.scan(text, policy, context=mock_context)
+    results = lg_scanner.scan(text, policy, context=mock_context)
 
     detected_texts = [text[r.start : r.end] for r in results]
     entity_types = [r.entity_type for r in results]
@@ -12,18 +12,23 @@ import logging
 from typing import AsyncGenerator, Generator
 from unittest.mock import MagicMock, patch
 
+import anyio
 import pytest
+from cachetools import TTLCache
 from coreason_identity.models import UserContext
 from loguru import logger
 from presidio_analyzer import RecognizerResult
 
 from coreason_aegis.main import Aegis, AegisAsync
+from coreason_aegis.scanner import Scanner
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_scanner_engine() -> Generator[MagicMock, None, None]:
     # Mock the internal AnalyzerEngine to avoid loading models
     # Patch the class so that if instantiated, it returns a mock.
+    # Module scope mirrors production: the engine is built once and shared by every
+    # Aegis instance. (Session scope would leak the patch into other test modules.)
     with patch("coreason_aegis.scanner.AnalyzerEngine") as mock:
         # Crucial: Ensure the module-level cache is None so that Scanner
         # calls AnalyzerEngine() (hitting our mock) instead of using a cached real instance.
@@ -31,6 +36,12 @@ def mock_scanner_engine() -> Generator[MagicMock, None, None]:
             yield mock
 
 
+@pytest.fixture(autouse=True)
+def _reset_scanner_engine(mock_scanner_engine: MagicMock) -> None:
+    # Each test configures its own analyze() behaviour on the shared engine.
+    mock_scanner_engine.return_value.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def aegis(mock_scanner_engine: MagicMock) -> Aegis:
     # No singleton reset needed for Scanner anymore, but we need to ensure
@@ -91,6 +102,64 @@ def test_sanitize_flow(aegis: Aegis, mock_scanner_engine: MagicMock, mock_contex
     mock_instance.analyze.assert_called_once()
 
 
+def test_sanitize_batch_flow(aegis: Aegis, mock_scanner_engine: MagicMock, mock_context: UserContext) -> None:
+    texts = [f"John has secret {i}." for i in range(64)]
+    session_ids = [f"sess_batch_{i}" for i in range(64)]
+
+    with patch("coreason_aegis.scanner.BatchAnalyzerEngine") as mock_batch:
+        mock_batch.return_value.analyze_iterator.side_effect = lambda texts, **kwargs: [
+            [RecognizerResult("PERSON", 0, 4, 1.0)] for _ in texts
+        ]
+        with aegis:
+            outputs = aegis.sanitize_batch(texts, session_ids, context=mock_context, batch_size=16)
+
+    assert [masked for masked, _ in outputs] == [f"[PATIENT_A] has secret {i}." for i in range(64)]
+    assert all(deid_map.session_id == sid for (_, deid_map), sid in zip(outputs, session_ids, strict=True))
+
+    # One batched analysis instead of one analyze() call per text
+    mock_batch.return_value.analyze_iterator.assert_called_once()
+    assert mock_batch.return_value.analyze_iterator.call_args.kwargs["batch_size"] == 16
+    mock_scanner_engine.return_value.analyze.assert_not_called()
+
+
+def test_sanitize_batch_length_mismatch(aegis: Aegis, mock_context: UserContext) -> None:
+    with pytest.raises(ValueError, match="same length"):
+        aegis.sanitize_batch(["a", "b"], ["s1"], context=mock_context)
+
+
+def test_sanitize_batch_fail_closed(
+    aegis: Aegis, mock_scanner_engine: MagicMock, mock_context: UserContext, log_sink: list[str]
+) -> None:
+    with patch("coreason_aegis.scanner.BatchAnalyzerEngine") as mock_batch:
+        mock_batch.return_value.analyze_iterator.side_effect = Exception("Critical Failure")
+        with pytest.raises(RuntimeError, match="Scan operation failed"):
+            aegis.sanitize_batch(["input"], ["sess_fail"], context=mock_context)
+
+    assert any("Batch sanitization failed" in log for log in log_sink)
+
+
+def test_sanitize_batch_secret_key_alert(
+    aegis: Aegis, mock_scanner_engine: MagicMock, mock_context: UserContext, log_sink: list[str]
+) -> None:
+    with patch("coreason_aegis.scanner.BatchAnalyzerEngine") as mock_batch:
+        mock_batch.return_value.analyze_iterator.return_value = [[RecognizerResult("SECRET_KEY", 0, 6, 1.0)]]
+        outputs = aegis.sanitize_batch(["sk-123 leaked"], ["sess_key"], context=mock_context)
+
+    assert outputs[0][0] == "[SECRET_KEY_A] leaked"
+    assert any("Credential Exposure Attempt detected" in log for log in log_sink)
+
+
+def test_analyzer_engine_shared_across_instances(mock_scanner_engine: MagicMock) -> None:
+    with patch("coreason_aegis.scanner._ANALYZER_ENGINE_CACHE", None):
+        mock_scanner_engine.reset_mock()
+        # Share one HTTP client; building 100 TLS contexts would dominate the test.
+        client = MagicMock()
+        instances = [Aegis(client=client) for _ in range(100)]
+
+    mock_scanner_engine.assert_called_once()
+    assert len({id(instance._async.scanner.analyzer) for instance in instances}) == 1
+
+
 @pytest.mark.asyncio
 async def test_sanitize_flow_async(
     aegis_async: AegisAsync, mock_scanner_engine: MagicMock, mock_context: UserContext
@@ -243,3 +312,103 @@ def test_story_b_leak_prevention(
             assert "sk-12345" not in str(message)
 
     assert found_alert, "Expected alert not found in logs"
+
+
+def test_credential_alerts_coalesced(
+    aegis: Aegis, mock_scanner_engine: MagicMock, log_sink: list[str], mock_context: UserContext
+) -> None:
+    keys = [f"sk-{c * 24}" for c in "abc"]
+    text = "Keys: " + " ".join(keys)
+    results = []
+    cursor = 0
+    for key in keys:
+        start = text.index(key, cursor)
+        cursor = start + len(key)
+        results.append(RecognizerResult("SECRET_KEY", start, cursor, 1.0))
+    mock_scanner_engine.return_value.analyze.return_value = results
+
+    with aegis:
+        masked_text, _ = aegis.sanitize(text, "story_b_storm", context=mock_context)
+
+    assert masked_text == "Keys: [SECRET_KEY_A] [SECRET_KEY_B] [SECRET_KEY_C]"
+    alerts = [log for log in log_sink if "Credential Exposure Attempt detected" in log]
+    assert len(alerts) == 1
+    assert "(3 keys)" in alerts[0]
+    assert "sk-" not in alerts[0]
+
+
+def test_aegis_with_injected_scanner(mock_context: UserContext) -> None:
+    engine = MagicMock()
+    engine.analyze.return_value = [RecognizerResult("PERSON", 0, 4, 1.0)]
+
+    with patch("coreason_aegis.scanner._get_analyzer_engine") as get_shared:
+        with Aegis(scanner=Scanner(analyzer=engine)) as aegis:
+            masked_text, _ = aegis.sanitize("John is here", "sess_di", context=mock_context)
+        get_shared.assert_not_called()
+
+    assert masked_text == "[PATIENT_A] is here"
+    engine.analyze.assert_called_once()
+
+
+def test_scan_cache_is_opt_in_and_follows_vault_ttl(mock_scanner_engine: MagicMock, mock_context: UserContext) -> None:
+    assert Aegis()._async.scanner._scan_cache is None
+
+    aegis = Aegis(vault_ttl=120, scan_cache_size=16)
+    mock_scanner_engine.return_value.analyze.return_value = [RecognizerResult("PERSON", 0, 4, 1.0)]
+    with aegis:
+        aegis.sanitize("John is here", "sess_cache_1", context=mock_context)
+        aegis.sanitize("John is here", "sess_cache_2", context=mock_context)
+
+    mock_scanner_engine.return_value.analyze.assert_called_once()
+    cache = aegis._async.scanner._scan_cache
+    assert isinstance(cache, TTLCache)
+    assert cache.ttl == 120
+
+
+@pytest.mark.asyncio
+async def test_sanitize_single_thread_hop(
+    aegis_async: AegisAsync, mock_scanner_engine: MagicMock, mock_context: UserContext
+) -> None:
+    mock_scanner_engine.return_value.analyze.return_value = [RecognizerResult("PERSON", 0, 4, 1.0)]
+    real_run_sync = anyio.to_thread.run_sync
+
+    with patch("anyio.to_thread.run_sync", side_effect=real_run_sync) as run_sync:
+        masked_text, _ = await aegis_async.sanitize("John is here", "sess_hop", context=mock_context)
+
+    assert masked_text == "[PATIENT_A] is here"
+    # Scan, alert and mask share one worker-thread round trip.
+    run_sync.assert_called_once()
+
+
+def test_sanitize_batch_groups_sessions(aegis: Aegis, mock_context: UserContext) -> None:
+    names = [f"Person{i:02d}" for i in range(16)]
+    # Two texts per session: the second mentions a new person, the first one again.
+    texts = [f"{name} here" for name in names] + [f"Other{i:02d} and {name}" for i, name in enumerate(names)]
+    session_ids = [f"sess_group_{i}" for i in range(16)] * 2
+
+    def analyze(texts: list[str], **kwargs: object) -> list[list[RecognizerResult]]:
+        out = []
+        for text in texts:
+            if text.startswith("Other"):
+                out.append([RecognizerResult("PERSON", 0, 7, 1.0), RecognizerResult("PERSON", 12, 20, 1.0)])
+            else:
+                out.append([RecognizerResult("PERSON", 0, 8, 1.0)])
+        return out
+
+    with patch("coreason_aegis.scanner.BatchAnalyzerEngine") as mock_batch:
+        mock_batch.return_value.analyze_iterator.side_effect = analyze
+        outputs = aegis.sanitize_batch(texts, session_ids, context=mock_context)
+
+    # Results come back in input order, and each session kept its own, ordered token space.
+    for i, name in enumerate(names):
+        assert outputs[i][0] == "[PATIENT_A] here"
+        assert outputs[16 + i][0] == "[PATIENT_B] and [PATIENT_A]"
+        assert outputs[16 + i][1].mappings == {"[PATIENT_A]": name, "[PATIENT_B]": f"Other{i:02d}"}
+
+
+def test_sanitize_batch_masking_fail_closed(aegis: Aegis, mock_context: UserContext) -> None:
+    with patch("coreason_aegis.scanner.BatchAnalyzerEngine") as mock_batch:
+        mock_batch.return_value.analyze_iterator.side_effect = lambda texts, **kwargs: [[] for _ in texts]
+        with patch.object(aegis._async.masking_engine, "mask_many", side_effect=RuntimeError("Vault down")):
+            with pytest.raises(RuntimeError, match="Vault down"):
+                aegis.sanitize_batch(["a", "b"], ["s1", "s2"], context=mock_context)
@@ -8,11 +8,13 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_aegis
 
+from unittest.mock import patch
+
 import pytest
 from coreason_identity.models import UserContext
 from faker import Faker
 
-from coreason_aegis.masking import MaskingEngine
+from coreason_aegis.masking import MaskingEngine, _indexed_token, _mask_token, _splice, _token_stem
 from coreason_aegis.models import AegisPolicy, RedactionMode
 from coreason_aegis.vault import VaultManager
 
@@ -44,6 +46,10 @@ def test_normalize_entity_type() -> None:
     assert MaskingEngine._normalize_entity_type("DATE_TIME") == "DATE"
     assert MaskingEngine._normalize_entity_type("EMAIL_ADDRESS") == "EMAIL"
     assert MaskingEngine._normalize_entity_type("UNKNOWN") == "UNKNOWN"
+    assert MaskingEngine._normalize_entity_type("PHONE_NUMBER") == "PHONE"
+    assert MaskingEngine._normalize_entity_type("IP_ADDRESS") == "IP"
+    assert MaskingEngine._normalize_entity_type("SECRET_KEY") == "SECRET_KEY"
+    assert MaskingEngine._normalize_entity_type("LOCATION") == "LOCATION"
 
 
 def test_mask_mode_mask(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
@@ -133,9 +139,22 @@ def test_allow_list(masking_engine: MaskingEngine, mock_context: UserContext) ->
     assert masked == "Tylenol"
 
 
-def test_overlapping_entities(masking_engine: MaskingEngine) -> None:
+def test_overlapping_entities(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
     # Test collision handling: Presidio can return overlapping entities.
-    pass
+    from presidio_analyzer import RecognizerResult
+
+    text = "Dr John Smith Jr visited"
+    # "John Smith" (3-13) overlaps "Smith Jr" (8-16): the later range is dropped.
+    # "visited" (17-24) does not overlap anything and is kept.
+    results = [
+        RecognizerResult("PERSON", 8, 16, 1.0),
+        RecognizerResult("PERSON", 3, 13, 1.0),
+        RecognizerResult("LOCATION", 17, 24, 1.0),
+    ]
+    policy = AegisPolicy(mode=RedactionMode.MASK)
+
+    masked, _ = masking_engine.mask(text, results, policy, "sess_overlap", context=mock_context)
+    assert masked == "Dr [PATIENT] Jr [LOCATION]"
 
 
 def test_multiple_entities_order(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
@@ -154,6 +173,22 @@ def test_multiple_entities_order(masking_engine: MaskingEngine, mock_context: Us
     assert masked == "[PATIENT_A] and [PATIENT_B]"
 
 
+def test_adjacent_and_unsorted_entities(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    from presidio_analyzer import RecognizerResult
+
+    text = "JohnJane met Bob"
+    # Out of order, adjacent (0-4, 4-8) and ending at the end of the text
+    results = [
+        RecognizerResult("PERSON", 13, 16, 1.0),
+        RecognizerResult("PERSON", 4, 8, 1.0),
+        RecognizerResult("PERSON", 0, 4, 1.0),
+    ]
+    policy = AegisPolicy(mode=RedactionMode.REPLACE)
+
+    masked, _ = masking_engine.mask(text, results, policy, "sess_adjacent", context=mock_context)
+    assert masked == "[PATIENT_A][PATIENT_B] met [PATIENT_C]"
+
+
 def test_synthetic_fallback(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
     """Test fallback logic for synthetic data generation."""
     from presidio_analyzer import RecognizerResult
@@ -205,3 +240,178 @@ def test_synthetic_types(masking_engine: MaskingEngine, mock_context: UserContex
     res_date = [RecognizerResult("DATE_TIME", 0, 3, 1.0)]
     masked, _ = masking_engine.mask("now", res_date, policy, "sess_syn_types", context=mock_context)
     assert isinstance(masked, str)
+
+
+def test_splice_matches_reverse_rewrite() -> None:
+    text = " ".join(f"w{i}" for i in range(705))
+    replacements = []
+    cursor = 0
+    for i in range(705):
+        start = text.index(f"w{i}", cursor)
+        cursor = start + len(f"w{i}")
+        if i % 3:
+            replacements.append((start, cursor, f"[T_{i}]"))
+
+    expected = text
+    for start, end, repl in reversed(replacements):
+        expected = expected[:start] + repl + expected[end:]
+
+    assert _splice(text, replacements) == expected
+    assert _splice(text, []) is text
+
+
+def test_mask_result_order_does_not_matter(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    import random
+
+    from presidio_analyzer import RecognizerResult
+
+    text = " ".join(f"Name{i}" for i in range(50))
+    results = []
+    cursor = 0
+    for i in range(50):
+        start = text.index(f"Name{i}", cursor)
+        cursor = start + len(f"Name{i}")
+        results.append(RecognizerResult("PERSON", start, cursor, 1.0))
+    shuffled = results[:]
+    random.Random(0).shuffle(shuffled)
+    policy = AegisPolicy(mode=RedactionMode.REPLACE)
+
+    ordered, ordered_map = masking_engine.mask(text, results, policy, "sess_order_1", context=mock_context)
+    unordered, unordered_map = masking_engine.mask(text, shuffled, policy, "sess_order_2", context=mock_context)
+
+    # Tokens are assigned by position in the text, not by the order the scanner reported spans.
+    assert unordered == ordered
+    assert unordered_map.mappings == ordered_map.mappings
+
+
+def test_mask_high_volume_entities(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    from presidio_analyzer import RecognizerResult
+
+    names = [f"Name{i}" for i in range(705)]
+    text = ", ".join(names)
+    results = []
+    cursor = 0
+    for name in names:
+        start = text.index(name, cursor)
+        cursor = start + len(name)
+        results.append(RecognizerResult("PERSON", start, cursor, 1.0))
+    policy = AegisPolicy(mode=RedactionMode.REPLACE)
+
+    masked, deid_map = masking_engine.mask(text, results, policy, "sess_volume", context=mock_context)
+
+    tokens = masked.split(", ")
+    assert tokens[0] == "[PATIENT_A]"
+    assert tokens[25] == "[PATIENT_Z]"
+    assert tokens[26] == "[PATIENT_AA]"
+    assert tokens[701] == "[PATIENT_ZZ]"
+    assert tokens[702] == "[PATIENT_AAA]"
+    assert len(deid_map.mappings) == 705
+    assert deid_map.mappings["[PATIENT_AAC]"] == "Name704"
+
+
+def test_token_stem() -> None:
+    assert _token_stem("PERSON") == "[PATIENT_"
+    assert _token_stem("DATE_TIME") == "[DATE_"
+    assert _token_stem("MRN") == "[MRN_"
+    assert _token_stem("PERSON") is _token_stem("PERSON")
+
+
+def test_mask_tokens_are_shared() -> None:
+    assert _mask_token("PERSON") == "[PATIENT]"
+    assert _mask_token("SECRET_KEY") == "[SECRET_KEY]"
+    assert _mask_token("PERSON") is _mask_token("PERSON")
+
+
+def test_indexed_tokens() -> None:
+    assert _indexed_token("PERSON", 0) == "[PATIENT_A]"
+    assert _indexed_token("PERSON", 701) == "[PATIENT_ZZ]"
+    assert _indexed_token("PERSON", 702) == "[PATIENT_AAA]"
+    assert _indexed_token("MRN", 1) is _indexed_token("MRN", 1)
+
+
+def test_tokens_shared_for_runtime_entity_types() -> None:
+    # Entity types built at runtime (e.g. decoded from a JSON policy) are equal to, but not
+    # the same object as, the literals in the code; token caches still hand back one string.
+    runtime_type = "".join(["PER", "SON"])
+    assert _mask_token(runtime_type) is _mask_token("PERSON")
+    assert _token_stem(runtime_type) is _token_stem("PERSON")
+    assert _indexed_token(runtime_type, 3) is _indexed_token("PERSON", 3)
+
+
+def test_replace_tokens_not_reformatted_across_sessions(
+    masking_engine: MaskingEngine, mock_context: UserContext
+) -> None:
+    from presidio_analyzer import RecognizerResult
+
+    text = "John met Jane."
+    results = [RecognizerResult("PERSON", 0, 4, 1.0), RecognizerResult("PERSON", 9, 13, 1.0)]
+    policy = AegisPolicy(mode=RedactionMode.REPLACE)
+
+    _, first_map = masking_engine.mask(text, results, policy, "sess_fmt_1", context=mock_context)
+    second, second_map = masking_engine.mask(text, results, policy, "sess_fmt_2", context=mock_context)
+
+    assert second == "[PATIENT_A] met [PATIENT_B]."
+    # The second session reuses the formatted token strings from the first.
+    assert list(second_map.mappings) == list(first_map.mappings)
+    assert all(a is b for a, b in zip(second_map.mappings, first_map.mappings, strict=True))
+
+
+def test_replace_tokens_are_shared(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    from presidio_analyzer import RecognizerResult
+
+    text = "John met John."
+    results = [RecognizerResult("PERSON", 0, 4, 1.0), RecognizerResult("PERSON", 9, 13, 1.0)]
+    policy = AegisPolicy(mode=RedactionMode.REPLACE)
+
+    masked, deid_map = masking_engine.mask(text, results, policy, "sess_shared_tokens", context=mock_context)
+
+    assert masked == "[PATIENT_A] met [PATIENT_A]."
+    # Repeats resolve to the token object already stored in the map.
+    (token,) = deid_map.mappings
+    assert deid_map.token_for("John") is token
+
+
+def test_mask_unknown_mode_falls_back_to_mask(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    from presidio_analyzer import RecognizerResult
+
+    results = [RecognizerResult("PERSON", 0, 4, 1.0)]
+    # Bypass validation to simulate a mode this engine does not know about.
+    policy = AegisPolicy.model_construct(mode="UNSUPPORTED", allow_list=[])
+
+    masked, deid_map = masking_engine.mask("John", results, policy, "sess_unknown_mode", context=mock_context)
+
+    assert masked == "[PATIENT]"
+    assert deid_map.mappings == {}
+
+
+def test_mask_many_matches_sequential_masks(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    from presidio_analyzer import RecognizerResult
+
+    texts = ["John met Jane.", "No entities here.", "Jane called John and Jim."]
+    results = [
+        [RecognizerResult("PERSON", 0, 4, 1.0), RecognizerResult("PERSON", 9, 13, 1.0)],
+        [],
+        [
+            RecognizerResult("PERSON", 0, 4, 1.0),
+            RecognizerResult("PERSON", 12, 16, 1.0),
+            RecognizerResult("PERSON", 21, 24, 1.0),
+        ],
+    ]
+    policy = AegisPolicy(mode=RedactionMode.REPLACE)
+
+    sequential_engine = MaskingEngine(VaultManager())
+    expected = [
+        sequential_engine.mask(text, res, policy, "sess_many", context=mock_context)[0]
+        for text, res in zip(texts, results, strict=True)
+    ]
+
+    with patch.object(masking_engine.vault, "save_map", wraps=masking_engine.vault.save_map) as save_map:
+        batch = masking_engine.mask_many(texts, results, policy, "sess_many", context=mock_context)
+
+    assert [masked for masked, _ in batch] == expected
+    assert expected[2] == "[PATIENT_B] called [PATIENT_A] and [PATIENT_C]."
+    save_map.assert_called_once()
+    deid_map = masking_engine.vault.get_map("sess_many", context=mock_context)
+    assert deid_map is not None
+    assert all(item_map is deid_map for _, item_map in batch)
+    assert deid_map.mappings == {"[PATIENT_A]": "John", "[PATIENT_B]": "Jane", "[PATIENT_C]": "Jim"}
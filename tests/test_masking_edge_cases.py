@@ -8,6 +8,8 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_aegis
 
+from datetime import timedelta
+
 import pytest
 from coreason_identity.models import UserContext
 from presidio_analyzer import RecognizerResult
@@ -26,8 +28,14 @@ def test_empty_results(masking_engine: MaskingEngine, mock_context: UserContext)
     text = "Nothing here."
     results: list[RecognizerResult] = []
     policy = AegisPolicy()
-    masked, _ = masking_engine.mask(text, results, policy, "sess_empty", context=mock_context)
-    assert masked == text
+    masked, deid_map = masking_engine.mask(text, results, policy, "sess_empty", context=mock_context)
+    assert masked is text
+    assert deid_map.mappings == {}
+    # The session is still created so later calls and re-identification can find it.
+    assert masking_engine.vault.get_map("sess_empty", context=mock_context) is deid_map
+
+    # Both timestamps come from one clock read.
+    assert deid_map.expires_at - deid_map.created_at == timedelta(hours=1)
 
 
 def test_empty_text(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
@@ -38,16 +46,17 @@ def test_empty_text(masking_engine: MaskingEngine, mock_context: UserContext) ->
     assert masked == ""
 
 
-def test_result_out_of_bounds(masking_engine: MaskingEngine) -> None:
-    # Should throw error or handle gracefully?
-    # Logic: text[start:end] will slice.
-    # But replacement construction uses start/end.
-    # masked_text[:start] + repl + masked_text[end:]
-    # If start > len, slice works (empty).
-    # If end > len, slice works.
-    # But if indices are wrong relative to text content, we might get weird string duplications or cuts.
-    # Presidio usually guarantees valid indices for the input text.
-    pass
+def test_result_out_of_bounds(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    # Presidio guarantees valid indices for the input text, but a span running past the end
+    # must still be handled gracefully: offsets are used directly (never re-located with
+    # text.find), so the slice is clamped and nothing is duplicated or cut.
+    text = "Hello John"
+    results = [RecognizerResult("PERSON", 6, 50, 1.0)]
+    policy = AegisPolicy(mode=RedactionMode.MASK)
+
+    masked, _ = masking_engine.mask(text, results, policy, "sess_oob", context=mock_context)
+
+    assert masked == "Hello [PATIENT]"
 
 
 def test_policy_allow_list_case_sensitivity(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
@@ -69,3 +78,82 @@ def test_policy_allow_list_case_sensitivity(masking_engine: MaskingEngine, mock_
     assert "[PATIENT]" in masked
     # masked should be "John vs [PATIENT]"
     assert masked == "John vs [PATIENT]"
+
+
+def test_policy_allow_list_exact_match_only(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    # Allow-list terms match whole entities only, never substrings or superstrings.
+    text = "John Doe and Tylenol"
+    results = [
+        RecognizerResult("PERSON", 0, 8, 1.0),
+        RecognizerResult("MEDICATION", 13, 20, 1.0),
+    ]
+    allow_list = [f"term{i}" for i in range(1000)] + ["John", "Tylenol"]
+    policy = AegisPolicy(mode=RedactionMode.MASK, allow_list=allow_list)
+
+    masked, _ = masking_engine.mask(text, results, policy, "sess_exact", context=mock_context)
+
+    assert masked == "[PATIENT] and Tylenol"
+
+
+def test_policy_allow_list_skips_token_allocation(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    # Allow-listed entities are skipped before any token is allocated, so they never
+    # consume a REPLACE suffix or appear in the session map.
+    text = "Tylenol for John"
+    results = [
+        RecognizerResult("PERSON", 0, 7, 1.0),
+        RecognizerResult("PERSON", 12, 16, 1.0),
+    ]
+    policy = AegisPolicy(mode=RedactionMode.REPLACE, allow_list=["Tylenol", "Tylenol"])
+
+    masked, deid_map = masking_engine.mask(text, results, policy, "sess_allow_replace", context=mock_context)
+
+    assert masked == "Tylenol for [PATIENT_A]"
+    assert deid_map.mappings == {"[PATIENT_A]": "John"}
+
+
+def test_allow_listed_span_shadows_nested_entity(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    # An allow-listed entity still wins the overlap, so a shorter entity inside it stays visible.
+    text = "Mount Sinai Hospital"
+    results = [
+        RecognizerResult("LOCATION", 0, 20, 0.9),
+        RecognizerResult("PERSON", 6, 11, 0.9),
+    ]
+    policy = AegisPolicy(mode=RedactionMode.MASK, allow_list=["Mount Sinai Hospital"])
+
+    masked, _ = masking_engine.mask(text, results, policy, "sess_shadow", context=mock_context)
+
+    assert masked == text
+
+
+def test_identical_spans_keep_first_result(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    # Two recognizers flag the same span with different types: the first result wins,
+    # and a shorter span nested inside a longer one is dropped.
+    text = "Paris Hilton visited"
+    results = [
+        RecognizerResult("PERSON", 0, 12, 0.8),
+        RecognizerResult("LOCATION", 0, 12, 0.8),
+        RecognizerResult("LOCATION", 0, 5, 0.9),
+    ]
+    policy = AegisPolicy(mode=RedactionMode.MASK)
+
+    masked, _ = masking_engine.mask(text, results, policy, "sess_tie", context=mock_context)
+
+    assert masked == "[PATIENT] visited"
+
+
+def test_rewrite_boundaries_and_unicode(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    # Entities touching both ends of the text, plus non-ASCII text between them:
+    # offsets are code points into the original text, never into the partially rewritten output.
+    text = "José 🚀 ünïcödé Zoë"
+    results = [
+        RecognizerResult("PERSON", 0, 4, 1.0),
+        RecognizerResult("PERSON", len(text) - 3, len(text), 1.0),
+    ]
+    policy = AegisPolicy(mode=RedactionMode.REPLACE)
+
+    masked, _ = masking_engine.mask(text, results, policy, "sess_unicode_bounds", context=mock_context)
+    assert masked == "[PATIENT_A] 🚀 ünïcödé [PATIENT_B]"
+
+    whole = [RecognizerResult("PERSON", 0, len(text), 1.0)]
+    masked_whole, _ = masking_engine.mask(text, whole, AegisPolicy(mode=RedactionMode.MASK), "s", context=mock_context)
+    assert masked_whole == "[PATIENT]"
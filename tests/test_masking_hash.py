@@ -14,12 +14,14 @@ import pytest
 from coreason_identity.models import UserContext
 from presidio_analyzer import RecognizerResult
 
-from coreason_aegis.masking import MaskingEngine
+from coreason_aegis.masking import MaskingEngine, _sha256_hex
 from coreason_aegis.models import AegisPolicy, RedactionMode
 from coreason_aegis.vault import VaultManager
 
 
-@pytest.fixture
+# These tests never depend on engine or vault state left by other tests (sessions are
+# distinct), so one engine is shared across the module.
+@pytest.fixture(scope="module")
 def masking_engine() -> MaskingEngine:
     return MaskingEngine(VaultManager())
 
@@ -36,6 +38,48 @@ def test_hash_consistency(masking_engine: MaskingEngine, mock_context: UserConte
     assert masked1 == hashlib.sha256("SecretData".encode()).hexdigest()
 
 
+def test_hash_multiple_entities_independent(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    # Each entity is hashed from a fresh state; earlier entities must not leak into later digests.
+    text = "Alice Bob"
+    results = [RecognizerResult("PERSON", 0, 5, 1.0), RecognizerResult("PERSON", 6, 9, 1.0)]
+    policy = AegisPolicy(mode=RedactionMode.HASH)
+
+    masked, _ = masking_engine.mask(text, results, policy, "sess_multi_hash", context=mock_context)
+
+    expected = f"{hashlib.sha256(b'Alice').hexdigest()} {hashlib.sha256(b'Bob').hexdigest()}"
+    assert masked == expected
+
+
+def test_hash_repeated_entities(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    text = "John, Jane and John"
+    results = [
+        RecognizerResult("PERSON", 0, 4, 1.0),
+        RecognizerResult("PERSON", 6, 10, 1.0),
+        RecognizerResult("PERSON", 15, 19, 1.0),
+    ]
+    policy = AegisPolicy(mode=RedactionMode.HASH)
+
+    masked, _ = masking_engine.mask(text, results, policy, "sess_hash_repeat", context=mock_context)
+    again, _ = masking_engine.mask(text, results, policy, "sess_hash_repeat_2", context=mock_context)
+
+    john = hashlib.sha256(b"John").hexdigest()
+    jane = hashlib.sha256(b"Jane").hexdigest()
+    assert masked == again == f"{john}, {jane} and {john}"
+
+
+def test_hash_unicode_spans(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    # Offsets are code points; each span is hashed from its own UTF-8 encoding.
+    text = "Renée 🚀 Zoë"
+    results = [RecognizerResult("PERSON", 0, 5, 1.0), RecognizerResult("PERSON", 8, 11, 1.0)]
+    policy = AegisPolicy(mode=RedactionMode.HASH)
+
+    masked, _ = masking_engine.mask(text, results, policy, "sess_hash_unicode", context=mock_context)
+
+    renee = hashlib.sha256("Renée".encode("utf-8")).hexdigest()
+    zoe = hashlib.sha256("Zoë".encode("utf-8")).hexdigest()
+    assert masked == f"{renee} 🚀 {zoe}"
+
+
 def test_hash_no_vault_storage(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
     # HASH mode is one-way, shouldn't store in vault mapping ideally?
     # Logic in masking.py:
@@ -79,3 +123,10 @@ def test_synthetic_different_inputs(masking_engine: MaskingEngine, mock_context:
 
     # High probability they are different
     assert masked1 != masked2
+
+
+def test_sha256_hex_shared_prefixes() -> None:
+    # The copied empty state must not carry data between calls, even for inputs that
+    # share a prefix or extend one another.
+    values = ["sk-", "sk-abc", "sk-abcdef", "sk-abc", ""]
+    assert [_sha256_hex(value) for value in values] == [hashlib.sha256(value.encode()).hexdigest() for value in values]
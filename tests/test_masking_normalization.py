@@ -9,12 +9,17 @@
 # Source Code: https://github.com/CoReason-AI/coreason_aegis
 
 import pytest
+from coreason_identity.models import UserContext
+from presidio_analyzer import RecognizerResult
 
 from coreason_aegis.masking import MaskingEngine
+from coreason_aegis.models import AegisPolicy, RedactionMode
 from coreason_aegis.vault import VaultManager
 
 
-@pytest.fixture
+# These tests never depend on engine or vault state left by other tests (sessions are
+# distinct), so one engine is shared across the module.
+@pytest.fixture(scope="module")
 def masking_engine() -> MaskingEngine:
     return MaskingEngine(VaultManager())
 
@@ -33,3 +38,27 @@ def test_standard_normalizations(masking_engine: MaskingEngine) -> None:
 def test_unknown_normalization(masking_engine: MaskingEngine) -> None:
     # Should pass through
     assert MaskingEngine._normalize_entity_type("CUSTOM_TYPE") == "CUSTOM_TYPE"
+
+
+def test_normalization_replace_mode(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    # Token stems in REPLACE mode use the same normalization as MASK tokens.
+    entities = [
+        ("John", "PERSON"),
+        ("2024-01-01", "DATE_TIME"),
+        ("a@b.com", "EMAIL_ADDRESS"),
+        ("555-0100", "PHONE_NUMBER"),
+        ("10.0.0.1", "IP_ADDRESS"),
+        ("sk-abcdefghijklmnopqrstu", "SECRET_KEY"),
+    ]
+    text = " ".join(value for value, _ in entities)
+    results = []
+    cursor = 0
+    for value, entity_type in entities:
+        results.append(RecognizerResult(entity_type, cursor, cursor + len(value), 1.0))
+        cursor += len(value) + 1
+
+    masked, _ = masking_engine.mask(
+        text, results, AegisPolicy(mode=RedactionMode.REPLACE), "sess_norm_replace", context=mock_context
+    )
+
+    assert masked == "[PATIENT_A] [DATE_A] [EMAIL_A] [PHONE_A] [IP_A] [SECRET_KEY_A]"
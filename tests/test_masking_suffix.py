@@ -10,7 +10,7 @@
 
 import pytest
 
-from coreason_aegis.masking import MaskingEngine
+from coreason_aegis.masking import MaskingEngine, _compute_suffix
 from coreason_aegis.vault import VaultManager
 
 
@@ -42,3 +42,30 @@ def test_large_number() -> None:
 def test_negative_input() -> None:
     with pytest.raises(ValueError):
         MaskingEngine._generate_suffix(-1)
+
+
+def test_table_boundary() -> None:
+    # Last precomputed suffix and first computed one
+    assert MaskingEngine._generate_suffix(701) == "ZZ"
+    assert MaskingEngine._generate_suffix(703) == "AAB"
+    assert [MaskingEngine._generate_suffix(i) for i in range(702)] == [_compute_suffix(i) for i in range(702)]
+
+
+def test_large_suffix_memoized() -> None:
+    assert MaskingEngine._generate_suffix(18277) == "ZZZ"
+    assert MaskingEngine._generate_suffix(18277) == "ZZZ"
+    assert _compute_suffix.cache_info().hits > 0
+
+
+def test_suffix_bijective_up_to_maxsize() -> None:
+    import sys
+
+    def decode(suffix: str) -> int:
+        value = 0
+        for char in suffix:
+            value = value * 26 + (ord(char) - 64)
+        return value - 1
+
+    assert MaskingEngine._generate_suffix(18278) == "AAAA"
+    for count in (0, 25, 26, 701, 702, 18277, 18278, 2**32, sys.maxsize):
+        assert decode(MaskingEngine._generate_suffix(count)) == count
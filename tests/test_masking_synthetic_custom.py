@@ -9,12 +9,13 @@
 # Source Code: https://github.com/CoReason-AI/coreason_aegis
 
 import re
+from unittest.mock import patch
 
 import pytest
 from coreason_identity.models import UserContext
 from presidio_analyzer import RecognizerResult
 
-from coreason_aegis.masking import MaskingEngine
+from coreason_aegis.masking import MaskingEngine, _synthetic_seed
 from coreason_aegis.models import AegisPolicy, RedactionMode
 from coreason_aegis.vault import VaultManager
 
@@ -252,3 +253,71 @@ def test_synthetic_unicode_input(masking_engine: MaskingEngine, mock_context: Us
     # Verify determinism for unicode too
     masked_text_2, _ = masking_engine.mask(text, results, policy, "session_unicode_2", context=mock_context)
     assert masked_text == masked_text_2
+
+
+def test_synthetic_consistency_across_instances(mock_context: UserContext) -> None:
+    """Separate engines (e.g. separate workers) must agree on the synthetic value for an entity."""
+    text = "Patient John Doe"
+    results = [RecognizerResult(entity_type="PERSON", start=8, end=16, score=1.0)]
+    policy = AegisPolicy(mode=RedactionMode.SYNTHETIC)
+
+    masked1, _ = MaskingEngine(VaultManager()).mask(text, results, policy, "s1", context=mock_context)
+    masked2, _ = MaskingEngine(VaultManager()).mask(text, results, policy, "s2", context=mock_context)
+
+    assert masked1 == masked2
+    assert masked1 != text
+
+
+def test_synthetic_thread_safety(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    """Concurrent SYNTHETIC masks on one engine must match their sequential outputs."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    texts = [f"Name{i} Surname{i}" for i in range(64)]
+    policy = AegisPolicy(mode=RedactionMode.SYNTHETIC)
+
+    def run(engine: MaskingEngine, text: str) -> str:
+        results = [RecognizerResult(entity_type="PERSON", start=0, end=len(text), score=1.0)]
+        return engine.mask(text, results, policy, f"sess_{text}", context=mock_context)[0]
+
+    # Sequential reference from a separate engine, so the concurrent run cannot be
+    # served from the synthetic cache.
+    reference = MaskingEngine(VaultManager())
+    expected = [run(reference, text) for text in texts]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(lambda text: run(masking_engine, text), texts)) == expected
+
+
+def test_synthetic_values_memoized(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    """Repeated entities are served from the cache instead of reseeding Faker."""
+    policy = AegisPolicy(mode=RedactionMode.SYNTHETIC)
+    text = "John Doe"
+    results = [RecognizerResult(entity_type="PERSON", start=0, end=8, score=1.0)]
+
+    original = masking_engine._get_synthetic_replacement
+    with patch.object(masking_engine, "_get_synthetic_replacement", wraps=original) as spy:
+        first, _ = masking_engine.mask(text, results, policy, "s1", context=mock_context)
+        second, _ = masking_engine.mask(text, results, policy, "s2", context=mock_context)
+
+    # Generation is keyed by the text's seed digest, never the text itself.
+    spy.assert_called_once_with(_synthetic_seed(text), len(text), "PERSON")
+
+    assert first == second
+
+
+def test_synthetic_repeats_within_one_call(masking_engine: MaskingEngine, mock_context: UserContext) -> None:
+    """Repeated entities in one text are generated once per (text, entity_type)."""
+    text = "John and Jane met John"
+    results = [
+        RecognizerResult(entity_type="PERSON", start=0, end=4, score=1.0),
+        RecognizerResult(entity_type="PERSON", start=9, end=13, score=1.0),
+        RecognizerResult(entity_type="PERSON", start=18, end=22, score=1.0),
+    ]
+    policy = AegisPolicy(mode=RedactionMode.SYNTHETIC)
+
+    original = masking_engine._get_synthetic_replacement
+    with patch.object(masking_engine, "_get_synthetic_replacement", wraps=original) as spy:
+        masked, _ = masking_engine.mask(text, results, policy, "s_repeat", context=mock_context)
+
+    assert spy.call_count == 2
+    first_john, rest = masked.split(" and ", 1)
+    assert rest.endswith(f" met {first_john}")
@@ -45,6 +45,12 @@ def test_masking_missing_context(mock_scanner_engine: MagicMock) -> None:
         masker.mask("text", [], policy, "s1", context=None)
 
 
+def test_masking_many_missing_context() -> None:
+    masker = MaskingEngine(VaultManager())
+    with pytest.raises(ValueError, match="UserContext is required"):
+        masker.mask_many(["text"], [[]], AegisPolicy(), "s1", context=None)
+
+
 def test_reidentifier_missing_context() -> None:
     vault = VaultManager()
     reid = ReIdentifier(vault)
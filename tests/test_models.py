@@ -8,12 +8,13 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_aegis
 
-from typing import cast
+from datetime import datetime, timezone
+from typing import Callable, Dict, cast
 
 import pytest
 from pydantic import ValidationError
 
-from coreason_aegis.models import AegisPolicy, RedactionMode
+from coreason_aegis.models import AegisPolicy, DeIdentificationMap, RedactionMode
 
 
 def test_aegis_policy_defaults() -> None:
@@ -45,3 +46,172 @@ def test_confidence_score_modification() -> None:
 def test_allow_list_default() -> None:
     policy = AegisPolicy()
     assert policy.allow_list == []
+
+
+def test_deid_map_reverse_lookup() -> None:
+    deid_map = DeIdentificationMap(
+        session_id="s1",
+        mappings={"[PATIENT_A]": "John"},
+        expires_at=datetime.now(timezone.utc),
+    )
+    assert deid_map.token_for("John") == "[PATIENT_A]"
+    assert deid_map.token_for("Jane") is None
+
+    deid_map.add_mapping("[PATIENT_B]", "Jane")
+    assert deid_map.mappings["[PATIENT_B]"] == "Jane"
+    assert deid_map.token_for("Jane") == "[PATIENT_B]"
+
+
+def test_deid_map_reverse_lookup_after_direct_edit() -> None:
+    deid_map = DeIdentificationMap(session_id="s1", expires_at=datetime.now(timezone.utc))
+    # Direct edits bypass add_mapping(); the index must resync on next lookup.
+    deid_map.mappings["[PATIENT_A]"] = "John"
+    assert deid_map.token_for("John") == "[PATIENT_A]"
+
+
+def test_deid_map_reverse_lookup_after_in_place_replace() -> None:
+    deid_map = DeIdentificationMap(
+        session_id="s1",
+        mappings={"[PATIENT_A]": "John"},
+        expires_at=datetime.now(timezone.utc),
+    )
+    assert deid_map.token_for("John") == "[PATIENT_A]"
+    # Replacing a value keeps the size unchanged; the index must still resync.
+    deid_map.mappings["[PATIENT_A]"] = "Jane"
+    assert deid_map.token_for("Jane") == "[PATIENT_A]"
+    assert deid_map.token_for("John") is None
+
+    # Swapping in a new dict of the same size is picked up too. The map keeps its own
+    # copy, so later edits to the assigned dict do not reach it.
+    replacement = {"[EMAIL_A]": "a@b.c"}
+    deid_map.mappings = replacement
+    replacement["[EMAIL_B]"] = "d@e.f"
+    assert deid_map.token_for("a@b.c") == "[EMAIL_A]"
+    assert deid_map.token_for("d@e.f") is None
+    assert deid_map.token_count("[PATIENT_") == 0
+
+
+def test_deid_map_unvalidated_mappings_are_versioned() -> None:
+    # model_construct() skips validation, leaving a plain dict in the field.
+    deid_map = DeIdentificationMap.model_construct(
+        session_id="s1", mappings={"[PATIENT_A]": "John"}, expires_at=datetime.now(timezone.utc)
+    )
+    assert deid_map.token_for("John") == "[PATIENT_A]"
+    deid_map.mappings["[PATIENT_A]"] = "Jane"
+    assert deid_map.token_for("Jane") == "[PATIENT_A]"
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        lambda m: m.__setitem__("[PATIENT_A]", "Jane"),
+        lambda m: m.__delitem__("[PATIENT_A]"),
+        lambda m: m.__ior__({"[PATIENT_B]": "Jim"}),
+        lambda m: m.clear(),
+        lambda m: m.pop("[PATIENT_A]"),
+        lambda m: m.popitem(),
+        lambda m: m.setdefault("[PATIENT_B]", "Jim"),
+        lambda m: m.update({"[PATIENT_A]": "Jane"}),
+    ],
+)
+def test_deid_map_mappings_edits_invalidate_caches(edit: Callable[[Dict[str, str]], object]) -> None:
+    deid_map = DeIdentificationMap(
+        session_id="s1",
+        mappings={"[PATIENT_A]": "John"},
+        expires_at=datetime.now(timezone.utc),
+    )
+    assert deid_map.token_for("John") == "[PATIENT_A]"
+
+    edit(deid_map.mappings)
+
+    assert deid_map.token_for("John") == ("[PATIENT_A]" if deid_map.mappings.get("[PATIENT_A]") == "John" else None)
+    assert deid_map.token_count("[PATIENT_") == len(deid_map.mappings)
+    # The wrapper is internal: the field still serializes as a plain mapping.
+    assert deid_map.model_dump()["mappings"] == dict(deid_map.mappings)
+
+
+def test_deid_map_token_count() -> None:
+    deid_map = DeIdentificationMap(
+        session_id="s1",
+        mappings={"[PATIENT_A]": "John", "[PATIENT_B]": "Jane", "[US_SSN_A]": "123-45-6789"},
+        expires_at=datetime.now(timezone.utc),
+    )
+    assert deid_map.token_count("[PATIENT_") == 2
+    assert deid_map.token_count("[US_SSN_") == 1
+    assert deid_map.token_count("[EMAIL_") == 0
+
+    deid_map.add_mapping("[PATIENT_C]", "Jim")
+    assert deid_map.token_count("[PATIENT_") == 3
+
+    # Re-adding an existing token must not count it twice.
+    deid_map.add_mapping("[PATIENT_C]", "Jim")
+    assert deid_map.token_count("[PATIENT_") == 3
+
+
+def test_deid_map_token_count_after_direct_edit() -> None:
+    deid_map = DeIdentificationMap(session_id="s1", expires_at=datetime.now(timezone.utc))
+    # Direct edits bypass add_mapping(); the counters must resync on next lookup.
+    deid_map.mappings["[PATIENT_A]"] = "John"
+    deid_map.add_mapping("[PATIENT_B]", "Jane")
+    assert deid_map.token_count("[PATIENT_") == 2
+
+
+def test_deid_map_reverse_lookup_with_shared_values() -> None:
+    # Two tokens for one value (e.g. a map written by an older release) must not
+    # force an index rebuild on every lookup.
+    deid_map = DeIdentificationMap(
+        session_id="s1",
+        mappings={"[PATIENT_A]": "John", "[PATIENT_B]": "John"},
+        expires_at=datetime.now(timezone.utc),
+    )
+    index = deid_map._reverse
+    assert deid_map.token_for("John") == "[PATIENT_B]"
+    assert deid_map.token_for("Jane") is None
+    assert deid_map._reverse is index
+
+
+def test_deid_map_add_mapping_repoints_token() -> None:
+    deid_map = DeIdentificationMap(session_id="s1", expires_at=datetime.now(timezone.utc))
+    deid_map.add_mapping("[PATIENT_A]", "John")
+    deid_map.add_mapping("[PATIENT_A]", "Jane")
+    assert deid_map.token_for("Jane") == "[PATIENT_A]"
+    assert deid_map.token_for("John") is None
+    assert deid_map.token_count("[PATIENT_") == 1
+
+
+def test_deid_map_token_pattern_bracketed_tokens() -> None:
+    deid_map = DeIdentificationMap(
+        session_id="s1",
+        mappings={"[A]": "Alice", "[AA]": "Bob", "[MRN.A]": "123"},
+        expires_at=datetime.now(timezone.utc),
+    )
+    pattern = deid_map.token_pattern()
+    # Bracketed tokens share one generic pattern; nothing is compiled per session.
+    assert pattern.findall("[AA] [A] [[MRN.A]]") == ["[AA]", "[A]", "[MRN.A]"]
+    assert deid_map.token_pattern() is pattern
+
+
+def test_deid_map_token_pattern_other_shapes() -> None:
+    deid_map = DeIdentificationMap(
+        session_id="s1",
+        mappings={"[A]": "Alice", "[AA]": "Bob"},
+        expires_at=datetime.now(timezone.utc),
+    )
+    generic = deid_map.token_pattern()
+
+    # A token outside the bracketed shape switches to an explicit alternation,
+    # longest token first.
+    deid_map.add_mapping("<B>", "Carol")
+    pattern = deid_map.token_pattern()
+    assert pattern is not generic
+    assert pattern.findall("[AA] <B> [A] [C]") == ["[AA]", "<B>", "[A]"]
+    assert deid_map.token_pattern() is pattern
+
+    # Direct edits are picked up too.
+    deid_map.mappings["X[C"] = "Dave"
+    assert deid_map.token_pattern().findall("X[C <B>") == ["X[C", "<B>"]
+
+    # Including re-keying a token without changing the number of tokens.
+    del deid_map.mappings["<B>"]
+    deid_map.mappings["<D>"] = "Carol"
+    assert deid_map.token_pattern().findall("X[C <B> <D>") == ["X[C", "<D>"]
@@ -8,6 +8,8 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_aegis
 
+from unittest.mock import patch
+
 import pytest
 from coreason_identity.models import UserContext
 
@@ -67,9 +69,12 @@ def test_reidentify_no_map(reidentifier: ReIdentifier, mock_context: UserContext
     assert result == "Hello [PATIENT_A]."
 
 
-def test_reidentify_empty_text(reidentifier: ReIdentifier, mock_context: UserContext) -> None:
-    result = reidentifier.reidentify("", "sess1", context=mock_context, authorized=True)
+def test_reidentify_empty_text(reidentifier: ReIdentifier, vault: VaultManager, mock_context: UserContext) -> None:
+    with patch.object(vault, "get_map", wraps=vault.get_map) as get_map:
+        result = reidentifier.reidentify("", "sess1", context=mock_context, authorized=True)
     assert result == ""
+    # Empty text returns before the vault is consulted.
+    get_map.assert_not_called()
 
 
 def test_reidentify_empty_mappings(reidentifier: ReIdentifier, vault: VaultManager, mock_context: UserContext) -> None:
@@ -136,3 +141,47 @@ def test_reidentify_nested_substrings(
 
     result = reidentifier.reidentify(text, session_id, context=mock_context, authorized=True)
     assert result == "This is Short and this is Long."
+
+
+def test_reidentify_single_pass(reidentifier: ReIdentifier, vault: VaultManager, mock_context: UserContext) -> None:
+    # A restored value that itself looks like a token must not be replaced again.
+    from datetime import datetime, timezone
+
+    session_id = "sess_single_pass"
+    deid_map = DeIdentificationMap(
+        session_id=session_id,
+        mappings={
+            "[PATIENT_A]": "[PATIENT_B]",
+            "[PATIENT_B]": "Jane",
+            "[MRN.A]": "123456",
+        },
+        expires_at=datetime.now(timezone.utc),
+    )
+    vault.save_map(deid_map, context=mock_context)
+
+    text = "[PATIENT_A], [PATIENT_B], [MRN.A] and [MRNXA]"
+    result = reidentifier.reidentify(text, session_id, context=mock_context, authorized=True)
+    assert result == "[PATIENT_B], Jane, 123456 and [MRNXA]"
+
+
+def test_reidentify_unknown_and_unusual_tokens(
+    reidentifier: ReIdentifier, vault: VaultManager, mock_context: UserContext
+) -> None:
+    from datetime import datetime, timezone
+
+    session_id = "sess_unusual"
+    deid_map = DeIdentificationMap(
+        session_id=session_id,
+        mappings={"[PATIENT_A]": "John", "<KEY>": "sk-123"},
+        expires_at=datetime.now(timezone.utc),
+    )
+    vault.save_map(deid_map, context=mock_context)
+
+    # Bracketed text that is not a token of this session is left untouched.
+    text = "[PATIENT_A] used <KEY> on [PATIENT_B] [see notes]"
+    result = reidentifier.reidentify(text, session_id, context=mock_context, authorized=True)
+    assert result == "John used sk-123 on [PATIENT_B] [see notes]"
+
+    deid_map.mappings.pop("<KEY>")
+    result = reidentifier.reidentify(text, session_id, context=mock_context, authorized=True)
+    assert result == "John used <KEY> on [PATIENT_B] [see notes]"
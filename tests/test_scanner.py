@@ -8,6 +8,7 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_aegis
 
+import hashlib
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
@@ -16,7 +17,13 @@ from coreason_identity.models import UserContext
 from presidio_analyzer import RecognizerResult
 
 from coreason_aegis.models import AegisPolicy
-from coreason_aegis.scanner import Scanner
+from coreason_aegis.scanner import (
+    DEFAULT_NER_MODEL,
+    CustomPatternRecognizer,
+    Scanner,
+    _create_nlp_engine,
+    get_ner_model,
+)
 
 
 @pytest.fixture
@@ -62,10 +69,26 @@ def test_scanner_shared_engine(mock_analyzer_engine: MagicMock) -> None:
     mock_analyzer_engine.assert_called_once()
 
 
-def test_scan_empty_text(scanner: Scanner, mock_context: UserContext) -> None:
+def test_scan_empty_text(scanner: Scanner, mock_analyzer_engine: MagicMock, mock_context: UserContext) -> None:
     policy = AegisPolicy()
     results = scanner.scan("", policy, context=mock_context)
     assert results == []
+    mock_analyzer_engine.return_value.analyze.assert_not_called()
+
+
+def test_scan_empty_entity_types_still_scans(
+    scanner: Scanner, mock_analyzer_engine: MagicMock, mock_context: UserContext
+) -> None:
+    # Presidio treats an empty entity list as "all supported entities", so an empty
+    # policy must not short-circuit to "nothing found" (Fail Closed).
+    mock_instance = mock_analyzer_engine.return_value
+    mock_result = RecognizerResult(entity_type="PERSON", start=0, end=4, score=0.9)
+    mock_instance.analyze.return_value = [mock_result]
+
+    results = scanner.scan("John", AegisPolicy(entity_types=[]), context=mock_context)
+
+    assert results == [mock_result]
+    mock_instance.analyze.assert_called_once()
 
 
 def test_scan_success(scanner: Scanner, mock_analyzer_engine: MagicMock, mock_context: UserContext) -> None:
@@ -108,3 +131,227 @@ def test_initialization_failure() -> None:
         with patch("coreason_aegis.scanner.AnalyzerEngine", side_effect=Exception("Init failed")):
             with pytest.raises(RuntimeError, match="Scanner initialization failed"):
                 Scanner()
+
+
+def test_scanner_with_injected_analyzer(mock_context: UserContext) -> None:
+    engine = MagicMock()
+    engine.analyze.return_value = [RecognizerResult(entity_type="PERSON", start=0, end=4, score=0.9)]
+
+    with patch("coreason_aegis.scanner._get_analyzer_engine") as get_shared:
+        scanner = Scanner(analyzer=engine)
+        get_shared.assert_not_called()
+
+    assert scanner.analyzer is engine
+    assert scanner.scan("John", AegisPolicy(), mock_context)[0].entity_type == "PERSON"
+    engine.analyze.assert_called_once()
+
+
+def test_scan_results_are_not_memoized_by_default(
+    scanner: Scanner, mock_analyzer_engine: MagicMock, mock_context: UserContext
+) -> None:
+    mock_instance = mock_analyzer_engine.return_value
+    mock_instance.analyze.return_value = []
+    policy = AegisPolicy(entity_types=["PERSON"])
+
+    scanner.scan("John", policy, mock_context)
+    scanner.scan("John", policy, mock_context)
+    assert mock_instance.analyze.call_count == 2
+
+
+def test_scan_results_are_memoized(mock_analyzer_engine: MagicMock, mock_context: UserContext) -> None:
+    scanner = Scanner(cache_size=8)
+    mock_instance = mock_analyzer_engine.return_value
+    mock_instance.analyze.side_effect = lambda **_: [RecognizerResult(entity_type="PERSON", start=0, end=4, score=0.9)]
+    policy = AegisPolicy(entity_types=["PERSON"])
+
+    first = scanner.scan("John", policy, mock_context)
+    second = scanner.scan("John", policy, mock_context)
+    assert first == second
+    mock_instance.analyze.assert_called_once()
+
+    # Callers get their own result objects, so mutating one does not leak into the cache.
+    assert second[0] is not first[0]
+    second[0].score = 0.1
+    assert scanner.scan("John", policy, mock_context)[0].score == 0.9
+
+    # The cache key holds a digest of the text, never the text itself.
+    assert scanner._scan_cache is not None
+    assert [key[0] for key in scanner._scan_cache] == [hashlib.sha256(b"John").digest()]
+
+    # Any policy field that affects the analysis is part of the key.
+    scanner.scan("John", AegisPolicy(entity_types=["PERSON"], confidence_score=0.5), mock_context)
+    scanner.scan("John", AegisPolicy(entity_types=["PERSON"], allow_list=["John"]), mock_context)
+    assert mock_instance.analyze.call_count == 3
+
+    # Registering a recognizer invalidates earlier entries.
+    mock_instance.registry.recognizers = [MagicMock()]
+    scanner.scan("John", policy, mock_context)
+    assert mock_instance.analyze.call_count == 4
+
+    # So does replacing one, even though the number of recognizers is unchanged.
+    mock_instance.registry.recognizers = [MagicMock()]
+    scanner.scan("John", policy, mock_context)
+    assert mock_instance.analyze.call_count == 5
+    scanner.scan("John", policy, mock_context)
+    assert mock_instance.analyze.call_count == 5
+
+    scanner.clear_cache()
+    scanner.scan("John", policy, mock_context)
+    assert mock_instance.analyze.call_count == 6
+
+
+def test_scan_cache_entries_expire(mock_analyzer_engine: MagicMock, mock_context: UserContext) -> None:
+    now = [0.0]
+    scanner = Scanner(cache_size=8, cache_ttl_seconds=60, timer=lambda: now[0])
+    mock_instance = mock_analyzer_engine.return_value
+    mock_instance.analyze.return_value = []
+    policy = AegisPolicy(entity_types=["PERSON"])
+
+    scanner.scan("John", policy, mock_context)
+    now[0] = 59
+    scanner.scan("John", policy, mock_context)
+    assert mock_instance.analyze.call_count == 1
+
+    now[0] = 61
+    scanner.scan("John", policy, mock_context)
+    assert mock_instance.analyze.call_count == 2
+
+
+def test_failed_scan_is_not_cached(mock_analyzer_engine: MagicMock, mock_context: UserContext) -> None:
+    scanner = Scanner(cache_size=8)
+    mock_instance = mock_analyzer_engine.return_value
+    mock_instance.analyze.side_effect = [Exception("boom"), []]
+    policy = AegisPolicy(entity_types=["PERSON"])
+
+    with pytest.raises(RuntimeError):
+        scanner.scan("John", policy, mock_context)
+    assert scanner.scan("John", policy, mock_context) == []
+
+
+def test_scan_batch(scanner: Scanner, mock_analyzer_engine: MagicMock, mock_context: UserContext) -> None:
+    john = RecognizerResult(entity_type="PERSON", start=0, end=4, score=0.9)
+    jane = RecognizerResult(entity_type="PERSON", start=0, end=4, score=0.9)
+    policy = AegisPolicy(entity_types=["PERSON"])
+
+    with patch("coreason_aegis.scanner.BatchAnalyzerEngine") as mock_batch:
+        analyze_iterator = mock_batch.return_value.analyze_iterator
+        analyze_iterator.return_value = [[john], [jane]]
+
+        results = scanner.scan_batch(["John", "", "Jane", "John"], policy, mock_context, batch_size=8)
+
+        # Empty texts are skipped and duplicates are analyzed once.
+        assert results == [[john], [], [jane], [john]]
+        assert results[3][0] is not results[0][0]
+        analyze_iterator.assert_called_once_with(
+            ["John", "Jane"],
+            language="en",
+            batch_size=8,
+            entities=["PERSON"],
+            score_threshold=policy.confidence_score,
+            allow_list=[],
+        )
+        mock_batch.assert_called_once_with(analyzer_engine=mock_analyzer_engine.return_value)
+
+
+def test_scan_batch_shares_cache(mock_analyzer_engine: MagicMock, mock_context: UserContext) -> None:
+    scanner = Scanner(cache_size=8)
+    john = RecognizerResult(entity_type="PERSON", start=0, end=4, score=0.9)
+    jane = RecognizerResult(entity_type="PERSON", start=0, end=4, score=0.8)
+    policy = AegisPolicy(entity_types=["PERSON"])
+
+    with patch("coreason_aegis.scanner.BatchAnalyzerEngine") as mock_batch:
+        analyze_iterator = mock_batch.return_value.analyze_iterator
+        analyze_iterator.return_value = [[john], [jane]]
+        scanner.scan_batch(["John", "Jane"], policy, mock_context)
+
+        # Batch results are shared with the single-text memoization cache.
+        assert scanner.scan("Jane", policy, mock_context) == [jane]
+        mock_analyzer_engine.return_value.analyze.assert_not_called()
+        assert scanner.scan_batch(["John"], policy, mock_context) == [[john]]
+        analyze_iterator.assert_called_once()
+
+
+def test_scan_batch_fail_closed(scanner: Scanner, mock_context: UserContext) -> None:
+    with patch("coreason_aegis.scanner.BatchAnalyzerEngine") as mock_batch:
+        mock_batch.return_value.analyze_iterator.side_effect = Exception("Batch Error")
+        with pytest.raises(RuntimeError, match="Scan operation failed: Batch Error"):
+            scanner.scan_batch(["John"], AegisPolicy(), mock_context)
+
+
+def test_scan_batch_missing_context(scanner: Scanner) -> None:
+    with pytest.raises(ValueError, match="UserContext is required"):
+        scanner.scan_batch(["John"], AegisPolicy(), None)
+
+
+def test_custom_pattern_recognizer_detects_all_entities() -> None:
+    recognizer = CustomPatternRecognizer()
+    text = "MRN 12345678, protocol ABC-123, lot LOT-A1B2, CAS 7732-18-5, key sk-abcdefghij1234567890XY."
+
+    results = recognizer.analyze(text, ["MRN", "PROTOCOL_ID", "LOT_NUMBER", "CHEMICAL_CAS", "SECRET_KEY"])
+    found = {(r.entity_type, text[r.start : r.end]) for r in results}
+    assert found == {
+        ("MRN", "12345678"),
+        ("PROTOCOL_ID", "ABC-123"),
+        ("LOT_NUMBER", "LOT-A1B2"),
+        ("CHEMICAL_CAS", "7732-18-5"),
+        ("SECRET_KEY", "sk-abcdefghij1234567890XY"),
+    }
+    key = next(r for r in results if r.entity_type == "SECRET_KEY")
+    assert key.score == 0.95
+    assert key.recognition_metadata[RecognizerResult.RECOGNIZER_IDENTIFIER_KEY] == recognizer.id
+
+
+def test_custom_pattern_recognizer_respects_requested_entities() -> None:
+    recognizer = CustomPatternRecognizer()
+    text = "MRN 12345678 and protocol ABC-123"
+
+    results = recognizer.analyze(text, ["PROTOCOL_ID"])
+    assert [text[r.start : r.end] for r in results] == ["ABC-123"]
+
+    # Nothing requested from this recognizer.
+    assert recognizer.analyze(text, ["PERSON"]) == []
+
+
+def test_custom_pattern_recognizer_reports_overlapping_matches() -> None:
+    # "1234567-12-3" is a CAS number that starts with an MRN-like digit run. Both are
+    # reported; the masking engine keeps the longer span.
+    recognizer = CustomPatternRecognizer()
+    text = "CAS 1234567-12-3"
+
+    results = recognizer.analyze(text, ["MRN", "CHEMICAL_CAS"])
+    assert {(r.entity_type, text[r.start : r.end]) for r in results} == {
+        ("CHEMICAL_CAS", "1234567-12-3"),
+        ("MRN", "1234567"),
+    }
+
+
+def test_ner_model_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("AEGIS_NER_MODEL", raising=False)
+    assert get_ner_model() == DEFAULT_NER_MODEL == "en_core_web_lg"
+
+    monkeypatch.setenv("AEGIS_NER_MODEL", "en_core_web_sm")
+    assert get_ner_model() == "en_core_web_sm"
+
+
+def test_ner_model_reports_engine_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The engine's model wins over whatever AEGIS_NER_MODEL says now.
+    monkeypatch.setenv("AEGIS_NER_MODEL", "en_core_web_sm")
+    scanner = Scanner(analyzer=MagicMock(nlp_engine=_create_nlp_engine("en_core_web_md")))
+    assert scanner.ner_model == "en_core_web_md"
+
+
+def test_ner_model_non_spacy_engine() -> None:
+    scanner = Scanner(analyzer=MagicMock(nlp_engine=MagicMock()))
+    assert scanner.ner_model == "MagicMock"
+
+
+def test_analyzer_uses_configured_model(mock_analyzer_engine: MagicMock, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AEGIS_NER_MODEL", "en_core_web_md")
+    Scanner()
+
+    nlp_engine = mock_analyzer_engine.call_args.kwargs["nlp_engine"]
+    assert nlp_engine.models == [{"lang_code": "en", "model_name": "en_core_web_md"}]
+    # Presidio's default NER mapping is preserved (e.g. FAC -> LOCATION).
+    assert nlp_engine.ner_model_configuration.model_to_presidio_entity_mapping["FAC"] == "LOCATION"
+    # The model is loaded by the AnalyzerEngine, not at construction time.
+    assert not nlp_engine.is_loaded()
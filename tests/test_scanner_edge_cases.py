@@ -15,11 +15,6 @@ from coreason_aegis.models import AegisPolicy
 from coreason_aegis.scanner import Scanner
 
 
-@pytest.fixture
-def scanner() -> Scanner:
-    return Scanner()
-
-
 @pytest.mark.integration
 def test_false_positive_avoidance(scanner: Scanner, mock_context: UserContext) -> None:
     """
@@ -8,6 +8,9 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_aegis
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
@@ -85,14 +88,15 @@ def test_custom_recognizer_idempotency(clean_scanner_state: None) -> None:
         _ = Scanner()
 
         # Verify recognizers added
-        # _load_custom_recognizers adds: MRN, PROTOCOL_ID, LOT_NUMBER, GENE, CAS, SECRET_KEY (6)
-        assert mock_registry.add_recognizer.call_count == 6
+        # _load_custom_recognizers adds one recognizer covering
+        # MRN, PROTOCOL_ID, LOT_NUMBER, GENE, CAS, SECRET_KEY
+        assert mock_registry.add_recognizer.call_count == 1
 
         # Second Init (should use cache)
         _ = Scanner()
 
         # Should not add anymore
-        assert mock_registry.add_recognizer.call_count == 6
+        assert mock_registry.add_recognizer.call_count == 1
 
 
 def test_stress_instantiation(clean_scanner_state: None) -> None:
@@ -112,3 +116,28 @@ def test_stress_instantiation(clean_scanner_state: None) -> None:
         # Verify all share the same analyzer
         first_analyzer = scanners[0].analyzer
         assert all(s.analyzer is first_analyzer for s in scanners)
+
+
+def test_concurrent_initialization_loads_once(clean_scanner_state: None) -> None:
+    """
+    Test Case: Concurrent Initialization.
+    Many threads constructing Scanners while the model is still loading must
+    share a single AnalyzerEngine instead of each loading their own.
+    """
+    barrier = threading.Barrier(8)
+
+    def slow_engine(*args: object, **kwargs: object) -> MagicMock:
+        time.sleep(0.05)
+        return MagicMock()
+
+    with patch("coreason_aegis.scanner.AnalyzerEngine", side_effect=slow_engine) as mock_engine_cls:
+
+        def build() -> Scanner:
+            barrier.wait()
+            return Scanner()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            scanners = list(pool.map(lambda _: build(), range(8)))
+
+    mock_engine_cls.assert_called_once()
+    assert len({id(s.analyzer) for s in scanners}) == 1
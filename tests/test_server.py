@@ -16,7 +16,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from coreason_aegis.models import DeIdentificationMap
-from coreason_aegis.server import app
+from coreason_aegis.server import SanitizeResponse, app
 
 
 @pytest.fixture
@@ -31,6 +31,7 @@ def mock_aegis_async() -> Generator[AsyncMock, None, None]:
         # Mock scanner analyzer for health check
         mock_instance.scanner = MagicMock()
         mock_instance.scanner.analyzer = "MockAnalyzer"
+        mock_instance.scanner.ner_model = "en_core_web_md"
 
         yield mock_instance
 
@@ -49,7 +50,7 @@ def test_health(client: TestClient, mock_aegis_async: AsyncMock) -> None:
     assert response.json() == {
         "status": "protected",
         "engine": "presidio",
-        "model": "en_core_web_lg",
+        "model": "en_core_web_md",
     }
 
 
@@ -91,6 +92,23 @@ def test_sanitize_success(client: TestClient, mock_aegis_async: AsyncMock) -> No
     assert call_args[0][2].user_id.get_secret_value() == "api-user-test-session"
 
 
+def test_sanitize_response_serialization(client: TestClient, mock_aegis_async: AsyncMock) -> None:
+    """Responses are compact UTF-8 JSON matching the pydantic model dump."""
+    deid_map = DeIdentificationMap(
+        session_id="test-session",
+        mappings={"[PATIENT_A]": "José 🚀"},
+        expires_at=datetime(2030, 1, 1, tzinfo=timezone.utc),
+    )
+    mock_aegis_async.sanitize.return_value = ("[PATIENT_A] est là", deid_map)
+
+    response = client.post("/sanitize", json={"text": "José est là", "session_id": "test-session"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    expected = SanitizeResponse(text="[PATIENT_A] est là", deid_map=deid_map).model_dump_json()
+    assert response.content == expected.encode("utf-8")
+
+
 def test_sanitize_fail_closed(client: TestClient, mock_aegis_async: AsyncMock) -> None:
     """Test that sanitize endpoint fails closed (500) on exception."""
     mock_aegis_async.sanitize.side_effect = Exception("Scanning failed")